@@ -38,7 +38,8 @@ from helpers import (
     login_required, admin_required, apology,
     format_timestamp, format_differential, sanitize_input,
     log_audit, check_disclaimer_acceptance, record_disclaimer_acceptance,
-    calculate_user_stats, calculate_system_stats, format_relative_time
+    calculate_user_stats, calculate_system_stats, format_relative_time,
+    configure_sqlite
 )
 
 # Try to import enhanced engine, fall back to basic if not available
@@ -53,7 +54,7 @@ except ImportError:
 
 # Try to import vital signs module
 try:
-    from vital_signs import VitalSigns, VitalSignsAnalyzer
+    from vital_signs import AlertLevel, VitalSigns, VitalSignsAnalyzer
     logger.info("✓ Vital signs module loaded")
     VITALS_AVAILABLE = True
 except ImportError:
@@ -195,6 +196,7 @@ Session(app)
 
 # Configure database
 db = SQL("sqlite:///cdss.db")
+configure_sqlite(db)
 
 # Initialize engine
 try:
@@ -465,7 +467,7 @@ def api_diagnose():
                 # Escalate if critical vitals
                 if vitals_analysis.red_flags:
                     critical_flags = [rf for rf in vitals_analysis.red_flags
-                                     if rf.level.value in ['critical', 'emergency']]
+                                     if rf.level >= AlertLevel.CRITICAL]
                     if critical_flags:
                         result_dict['is_critical'] = True
                         result_dict['urgency_score'] = 10
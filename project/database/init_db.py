@@ -40,6 +40,9 @@ def init_database(db_path='cdss.db', schema_path='schema.sql'):
     # Enable foreign keys
     cursor.execute("PRAGMA foreign_keys = ON")
 
+    # Write-ahead logging is stored in the database file, so set it once here
+    cursor.execute("PRAGMA journal_mode = WAL")
+
     # Read and execute schema
     print(f"📄 Loading schema from: {schema_path}")
     try:
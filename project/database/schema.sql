@@ -109,6 +109,13 @@ CREATE TABLE IF NOT EXISTS system_metrics (
 );
 
 
+CREATE TABLE IF NOT EXISTS stats_cache (
+    key TEXT PRIMARY KEY,
+    value NUMERIC,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+
 CREATE TABLE IF NOT EXISTS favorites (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     user_id INTEGER NOT NULL,
@@ -195,6 +202,7 @@ CREATE INDEX IF NOT EXISTS idx_users_last_login ON users(last_login DESC);
 CREATE INDEX IF NOT EXISTS idx_consultations_user ON consultations(user_id);
 CREATE INDEX IF NOT EXISTS idx_consultations_timestamp ON consultations(timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_consultations_user_timestamp ON consultations(user_id, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_consultations_user_stats ON consultations(user_id, timestamp, is_urgent, confidence_score);
 CREATE INDEX IF NOT EXISTS idx_consultations_diagnosis ON consultations(top_diagnosis);
 CREATE INDEX IF NOT EXISTS idx_consultations_urgent ON consultations(is_urgent) WHERE is_urgent = 1;
 CREATE INDEX IF NOT EXISTS idx_consultations_critical ON consultations(is_critical) WHERE is_critical = 1;
@@ -52,6 +52,39 @@ def update_database(db_path='cdss.db'):
         else:
             print("  ✓ duration_ms already exists")
 
+        # Covering index for the per-user statistics rollup
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_consultations_user_stats'"
+        )
+        if not cursor.fetchone():
+            print("  Adding idx_consultations_user_stats index...")
+            cursor.execute(
+                "CREATE INDEX idx_consultations_user_stats "
+                "ON consultations(user_id, timestamp, is_urgent, confidence_score)"
+            )
+            updates_made += 1
+            print("  ✓ Added idx_consultations_user_stats")
+        else:
+            print("  ✓ idx_consultations_user_stats already exists")
+
+        # Cached system statistics for the admin dashboard
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_cache'"
+        )
+        if not cursor.fetchone():
+            print("  Adding stats_cache table...")
+            cursor.execute("""
+                CREATE TABLE stats_cache (
+                    key TEXT PRIMARY KEY,
+                    value NUMERIC,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            updates_made += 1
+            print("  ✓ Added stats_cache")
+        else:
+            print("  ✓ stats_cache already exists")
+
         # Commit changes
         conn.commit()
 
@@ -25,6 +25,8 @@ import json
 import math
 import re
 import logging
+import threading
+from bisect import bisect_right
 from typing import Dict, List, Tuple, Optional, Set, Any
 from datetime import datetime
 from pathlib import Path
@@ -37,7 +39,8 @@ try:
         CRITICAL_PATTERNS,
         LOCATION_DISEASE_MAP,
         enhance_symptom_extraction,
-        apply_pattern_boosts
+        apply_pattern_boosts,
+        build_phrase_regex
     )
     ENHANCED_MAPPINGS_AVAILABLE = True
 except ImportError:
@@ -56,6 +59,12 @@ except ImportError:
     def apply_pattern_boosts(posteriors, patterns, locations):
         return posteriors
 
+    def build_phrase_regex(phrases):
+        alternation = '|'.join(
+            re.escape(p) for p in sorted(phrases, key=len, reverse=True) if p
+        )
+        return re.compile('(?=(' + alternation + '))')
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -64,6 +73,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Negation cues for context analysis, matched as whole
+# whitespace-delimited words (longest first so 'negative for' wins)
+NEGATION_WORDS = [
+    'no', 'not', 'denies', 'without', 'absent',
+    'negative', 'negative for', 'ruled out', 'r/o',
+    'never', 'none', 'lack of'
+]
+
+_NEGATION_RE = re.compile(
+    r'(?<!\S)(?:' +
+    '|'.join(re.escape(word) for word in sorted(NEGATION_WORDS, key=len, reverse=True)) +
+    r')(?!\S)'
+)
 
 
 @dataclass
@@ -142,6 +164,7 @@ class DiagnosticEngine:
 
         # Build comprehensive symptom lookup
         self.symptom_lookup = self._build_symptom_lookup()
+        self._build_symptom_scanner()
 
         # Define critical and urgent conditions
         self.critical_conditions = {
@@ -218,6 +241,15 @@ class DiagnosticEngine:
     def _build_symptom_lookup(self) -> Dict[str, str]:
 
         lookup = {}
+        collisions = []
+
+        def add(variant: str, target: str) -> None:
+            # Later sources still win, but a variant silently changing
+            # symptom is almost always a mapping mistake
+            previous = lookup.get(variant)
+            if previous is not None and previous != target:
+                collisions.append(f"'{variant}': {previous} -> {target}")
+            lookup[variant] = target
 
         # Add base mappings from model
         for original, variants in self.symptom_mappings.items():
@@ -225,12 +257,12 @@ class DiagnosticEngine:
                 continue
             for variant in variants:
                 if isinstance(variant, str):
-                    lookup[variant.lower()] = original
+                    add(variant.lower(), original)
 
         # Add enhanced medical synonyms if available
         if ENHANCED_MAPPINGS_AVAILABLE:
             for synonym, target in MEDICAL_SYNONYMS.items():
-                lookup[synonym.lower()] = target
+                add(synonym.lower(), target)
 
         # Add common abbreviations
         abbreviations = {
@@ -250,7 +282,12 @@ class DiagnosticEngine:
         }
 
         for abbr, target in abbreviations.items():
-            lookup[abbr] = target
+            add(abbr, target)
+
+        if collisions:
+            logger.warning(
+                f"{len(collisions)} symptom variant(s) remapped: {'; '.join(collisions)}"
+            )
 
         logger.debug(f"Built symptom lookup with {len(lookup)} entries")
         return lookup
@@ -259,6 +296,40 @@ class DiagnosticEngine:
 
 
 
+    def _build_symptom_scanner(self) -> None:
+        """Compile all lookup variants into a single-pass scanner"""
+
+        variants = [variant for variant in self.symptom_lookup if variant]
+        self._symptom_scanner = build_phrase_regex(variants)
+
+        # The scanner reports the longest variant at each position, which
+        # implies every shorter variant that is a prefix of it
+        known = set(variants)
+        self._variant_prefixes = {
+            variant: [variant[:i] for i in range(1, len(variant)) if variant[:i] in known] + [variant]
+            for variant in variants
+        }
+
+        # Lookup order, so results keep the order of the old per-variant loop
+        self._variant_rank = {variant: rank for rank, variant in enumerate(variants)}
+
+        # Fuzzy matching only considers single-word variants longer than 4
+        self._fuzzy_variants = [
+            (variant, original) for variant, original in self.symptom_lookup.items()
+            if ' ' not in variant and len(variant) > 4
+        ]
+
+    def _find_variants(self, text_lower: str) -> List[Tuple[str, int]]:
+        """(variant, first position) for every lookup variant in the text"""
+
+        first_pos: Dict[str, int] = {}
+        for match in self._symptom_scanner.finditer(text_lower):
+            pos = match.start()
+            for variant in self._variant_prefixes[match.group(1)]:
+                first_pos.setdefault(variant, pos)
+
+        return sorted(first_pos.items(), key=lambda item: self._variant_rank[item[0]])
+
     def extract_symptoms(self, text: str) -> Dict[str, bool]:
         if not text or not isinstance(text, str):
             raise ValueError("Text input must be a non-empty string")
@@ -273,54 +344,51 @@ class DiagnosticEngine:
 
         detected = {}
 
-        # Negation words for context analysis
-        negation_words = [
-            'no', 'not', 'denies', 'without', 'absent',
-            'negative', 'negative for', 'ruled out', 'r/o',
-            'never', 'none', 'lack of'
-        ]
+        # Locate negation cues once; spans are sorted and non-overlapping
+        negations = [match.span() for match in _NEGATION_RE.finditer(text_lower)]
+        negation_ends = [end for _, end in negations]
+        window = self.config.negation_window_chars
 
-        # Step 2: Search for each symptom variant
-        for variant, original in self.symptom_lookup.items():
-            # Look for the variant in text
-            if variant in text_lower:
-                # Check for negation in surrounding context (60 chars before)
-                variant_pos = text_lower.find(variant)
-                start_pos = max(0, variant_pos - self.config.negation_window_chars)
-                context = text_lower[start_pos:variant_pos]
-
-                # Check if any negation word appears in context
-                is_negated = any(
-                    neg_word in context.split()
-                    for neg_word in negation_words
-                )
+        # Step 2: Find every symptom variant in one pass over the text
+        for variant, variant_pos in self._find_variants(text_lower):
+            original = self.symptom_lookup[variant]
 
-                if not is_negated:
-                    detected[original] = True
-                    logger.debug(f"✓ Detected: {original} (from '{variant}')")
-                else:
-                    logger.debug(f"✗ Negated: {original} (from '{variant}')")
+            # Negated if the closest cue ending before the variant starts
+            # within the window (60 chars before)
+            index = bisect_right(negation_ends, variant_pos) - 1
+            is_negated = index >= 0 and negations[index][0] >= variant_pos - window
+
+            if not is_negated:
+                detected[original] = True
+                logger.debug(f"✓ Detected: {original} (from '{variant}')")
+            else:
+                logger.debug(f"✗ Negated: {original} (from '{variant}')")
 
         # Step 3: Fuzzy matching for close matches (helps with typos)
         if len(detected) < 3:  # Only do fuzzy if we haven't found much
             try:
                 from difflib import SequenceMatcher
 
-                words = text_lower.split()
+                # One matcher per distinct long word: SequenceMatcher caches
+                # its index of the second sequence, so only the variant changes
+                matchers = [
+                    (word, SequenceMatcher(None, '', word))
+                    for word in dict.fromkeys(text_lower.split()) if len(word) > 4
+                ]
 
-                for variant, original in self.symptom_lookup.items():
+                for variant, original in self._fuzzy_variants:
                     if original in detected:
                         continue  # Already found
 
-                    # Only fuzzy match single-word symptoms
-                    if ' ' not in variant and len(variant) > 4:
-                        for word in words:
-                            if len(word) > 4:
-                                similarity = SequenceMatcher(None, variant, word).ratio()
-                                if similarity > 0.85:  # 85% similar
-                                    detected[original] = True
-                                    logger.debug(f"✓ Fuzzy: {original} ('{word}' ~= '{variant}')")
-                                    break
+                    for word, matcher in matchers:
+                        matcher.set_seq1(variant)
+                        # Cheap upper bounds first; ratio() only if they pass
+                        if (matcher.real_quick_ratio() > 0.85
+                                and matcher.quick_ratio() > 0.85
+                                and matcher.ratio() > 0.85):  # 85% similar
+                            detected[original] = True
+                            logger.debug(f"✓ Fuzzy: {original} ('{word}' ~= '{variant}')")
+                            break
             except Exception as e:
                 logger.debug(f"Fuzzy matching skipped: {e}")
 
@@ -843,7 +911,7 @@ class DiagnosticEngine:
 
 
 _engine_instance: Optional[DiagnosticEngine] = None
-_engine_lock = None
+_engine_lock = threading.Lock()
 
 def get_engine(
     config: Optional[EngineConfig] = None,
@@ -852,9 +920,12 @@ def get_engine(
 
     global _engine_instance
 
+    # Double-checked so concurrent first requests load the model only once
     if _engine_instance is None or force_reload:
-        logger.info("Creating new engine instance")
-        _engine_instance = DiagnosticEngine(config)
+        with _engine_lock:
+            if _engine_instance is None or force_reload:
+                logger.info("Creating new engine instance")
+                _engine_instance = DiagnosticEngine(config)
 
     return _engine_instance
 
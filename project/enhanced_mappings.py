@@ -20,7 +20,11 @@ All code included in this repository was either written by me or reviewed,
 adapted, and implemented by me as part of the final system.
 
 """
-from typing import Dict, List, Tuple, Set, Optional
+from typing import Dict, List, Mapping, Tuple, Set, Optional
+from types import MappingProxyType
+from functools import lru_cache
+from pathlib import Path
+import json
 import re
 import logging
 
@@ -28,7 +32,7 @@ logger = logging.getLogger(__name__)
 
 
 
-MEDICAL_SYNONYMS: Dict[str, str] = {
+_MEDICAL_SYNONYMS: Dict[str, str] = {
 
 
     # Chest Pain - ALL variations
@@ -62,7 +66,6 @@ MEDICAL_SYNONYMS: Dict[str, str] = {
     'radiating to arm': 'chest_pain_radiating',
     'radiating to left arm': 'chest_pain_radiating',
     'radiating to jaw': 'chest_pain_radiating',
-    'radiating to back': 'chest_pain_radiating',
     'radiating to neck': 'chest_pain_radiating',
     'radiating to shoulder': 'chest_pain_radiating',
     'pain radiating': 'chest_pain_radiating',
@@ -89,7 +92,7 @@ MEDICAL_SYNONYMS: Dict[str, str] = {
     'breathlessness': 'breathlessness',
     'shortness of breath': 'breathlessness',
     'short of breath': 'breathlessness',
-    'SOB': 'breathlessness',
+    'sob': 'breathlessness',
     'dyspnea': 'breathlessness',
     'difficulty breathing': 'breathlessness',
     'labored breathing': 'breathlessness',
@@ -538,6 +541,14 @@ MEDICAL_SYNONYMS: Dict[str, str] = {
     'increased appetite': 'excessive_hunger',
 }
 
+# Phrases are matched against lowercased text, so keys must be unique
+# once lowercased and should be written in lowercase
+assert len({k.lower() for k in _MEDICAL_SYNONYMS}) == len(_MEDICAL_SYNONYMS), \
+    "MEDICAL_SYNONYMS has duplicate phrases"
+
+# Read-only view - the table is shared by the engine's symptom lookup
+MEDICAL_SYNONYMS: Mapping[str, str] = MappingProxyType(_MEDICAL_SYNONYMS)
+
 
 # Location to disease mapping 
 LOCATION_DISEASE_MAP: Dict[str, List[str]] = {
@@ -598,82 +609,378 @@ CRITICAL_PATTERNS: Dict[str, Dict] = {
 }
 
 
+# Optional observed hit counts, e.g.
+# {"patterns": {"mi_classic": 120}, "keywords": {"radiating": 80}}
+PATTERN_FREQUENCY_PATH = Path(__file__).with_name('pattern_frequencies.json')
+
+
+def _load_pattern_frequencies(path: Path) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Load pattern and keyword hit counts, or empty counts if unavailable"""
+
+    if not path.exists():
+        return {}, {}
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return dict(data.get('patterns', {})), dict(data.get('keywords', {}))
+    except (OSError, ValueError, AttributeError, TypeError) as e:
+        logger.warning(f"Ignoring pattern frequencies in {path}: {e}")
+        return {}, {}
+
+
+# Hot-first ordering: most frequently matched patterns are evaluated first
+# and each pattern lists its most common keywords first. The sorts are
+# stable, so without a frequency file the order above is kept.
+_pattern_freq, _keyword_freq = _load_pattern_frequencies(PATTERN_FREQUENCY_PATH)
+if _pattern_freq or _keyword_freq:
+    CRITICAL_PATTERNS = dict(sorted(
+        CRITICAL_PATTERNS.items(),
+        key=lambda item: -_pattern_freq.get(item[0], 0)
+    ))
+    for _info in CRITICAL_PATTERNS.values():
+        _info['keywords'] = sorted(
+            _info['keywords'],
+            key=lambda keyword: -_keyword_freq.get(keyword, 0)
+        )
+
+
+# Free-text scanner
+# Every location and keyword phrase gets a bit; one compiled regex walks
+# the text once in C instead of one substring search per phrase.
+_SCAN_PHRASES: Tuple[str, ...] = tuple(dict.fromkeys(
+    [location.lower() for location in LOCATION_DISEASE_MAP] +
+    [keyword.lower() for info in CRITICAL_PATTERNS.values() for keyword in info['keywords']]
+))
+
+_PHRASE_BIT: Dict[str, int] = {
+    phrase: 1 << index for index, phrase in enumerate(_SCAN_PHRASES)
+}
+
+# The regex reports the longest phrase starting at each position, so a
+# hit also implies every shorter phrase that is a prefix of it
+_PHRASE_HITS: Dict[str, int] = {
+    phrase: sum(bit for other, bit in _PHRASE_BIT.items() if phrase.startswith(other))
+    for phrase in _SCAN_PHRASES
+}
+
+
+def _build_phrase_trie(phrases: Tuple[str, ...]) -> Dict:
+    """Build a character trie; the empty-string key marks a phrase end"""
+
+    root: Dict = {}
+    for phrase in phrases:
+        if not phrase:
+            continue
+        node = root
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return root
+
+
+def _trie_to_regex(node: Dict) -> str:
+    """Render a trie as a regex so shared prefixes are matched only once.
+
+    Children of a node start with distinct characters and a phrase end is
+    an optional tail, so the regex always takes the longest phrase.
+    """
+
+    branches = [
+        re.escape(char) + _trie_to_regex(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ''
+
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        body = '(?:' + body + ')?'
+    return body
+
+
+def build_phrase_regex(phrases) -> 're.Pattern[str]':
+    """Compile a trie-shaped regex that finds literal phrases in one pass.
+
+    finditer() yields a match at every position where a phrase starts;
+    group(1) is the longest phrase there, so shorter phrases that are a
+    prefix of it also occur at that position.
+    """
+
+    return re.compile('(?=(' + _trie_to_regex(_build_phrase_trie(phrases)) + '))')
+
+
+# e.g. 'right lower quadrant', 'right upper quadrant' and 'right iliac
+# fossa' share a single walk over 'right '
+_SCAN_RE = build_phrase_regex(_SCAN_PHRASES)
+
+
+def _phrase_mask(phrases: List[str]) -> int:
+    """OR together the scan bits of the given phrases"""
+
+    mask = 0
+    for phrase in phrases:
+        mask |= _PHRASE_BIT[phrase.lower()]
+    return mask
+
+
+def _location_symptom(location: str) -> Optional[str]:
+    """Symptom implied by an anatomical location, if any"""
+
+    if 'rlq' in location or 'right lower quadrant' in location:
+        return 'abdominal_pain_rlq'
+    if 'ruq' in location or 'right upper quadrant' in location:
+        return 'abdominal_pain_ruq'
+    if 'llq' in location or 'left lower quadrant' in location:
+        return 'abdominal_pain_llq'
+    if 'epigastric' in location:
+        return 'epigastric_pain'
+    return None
+
+
+_LOCATION_SYMPTOMS: Dict[str, str] = {
+    location: symptom
+    for location in LOCATION_DISEASE_MAP
+    for symptom in [_location_symptom(location)]
+    if symptom
+}
+
+
+# Symptom bit field
+# Each known symptom tag owns one bit, so a set of symptoms is a single
+# int and pattern matching is an AND plus a popcount.
+SYMPTOM_TAGS: Tuple[str, ...] = tuple(sorted(
+    set(MEDICAL_SYNONYMS.values()) |
+    set(_LOCATION_SYMPTOMS.values()) |
+    {symptom for info in CRITICAL_PATTERNS.values() for symptom in info['symptoms']}
+))
+
+SYMPTOM_BIT: Dict[str, int] = {
+    symptom: 1 << index for index, symptom in enumerate(SYMPTOM_TAGS)
+}
+
+
+def to_bits(symptoms: Dict[str, bool]) -> int:
+    """Pack the present, known symptoms of a dict into a bit field"""
+
+    bits = 0
+    for symptom, present in symptoms.items():
+        if present:
+            bits |= SYMPTOM_BIT.get(symptom, 0)
+    return bits
+
+
+def from_bits(bits: int) -> Dict[str, bool]:
+    """Unpack a bit field into a {symptom: True} dict"""
+
+    return {symptom: True for symptom in _bit_names(bits, SYMPTOM_TAGS)}
+
+
+def _bit_names(bits: int, names: Tuple[str, ...]) -> List[str]:
+    """Names whose bit positions are set, lowest bit first"""
+
+    result = []
+    while bits:
+        low = bits & -bits
+        result.append(names[low.bit_length() - 1])
+        bits ^= low
+    return result
+
+
+# Structure-of-arrays view of CRITICAL_PATTERNS, indexed by pattern id,
+# so the matching loop reads flat tuples instead of nested dicts
+_P_NAMES: Tuple[str, ...] = tuple(CRITICAL_PATTERNS)
+_P_SYM_MASKS: Tuple[int, ...] = tuple(
+    to_bits(dict.fromkeys(info['symptoms'], True)) for info in CRITICAL_PATTERNS.values()
+)
+# Keyword bits resolved from the lowercased phrase once, at import
+_P_KW_BITS: Tuple[Tuple[Tuple[str, int], ...], ...] = tuple(
+    tuple((keyword, _PHRASE_BIT[keyword.lower()]) for keyword in info['keywords'])
+    for info in CRITICAL_PATTERNS.values()
+)
+_P_KW_MASKS: Tuple[int, ...] = tuple(
+    _phrase_mask(info['keywords']) for info in CRITICAL_PATTERNS.values()
+)
+_P_SYM_COUNTS: Tuple[int, ...] = tuple(
+    len(info['symptoms']) for info in CRITICAL_PATTERNS.values()
+)
+_P_KW_COUNTS: Tuple[int, ...] = tuple(
+    len(info['keywords']) for info in CRITICAL_PATTERNS.values()
+)
+
+_LOCATION_BITS: Tuple[Tuple[str, int, int], ...] = tuple(
+    (
+        location,
+        _PHRASE_BIT[location],
+        SYMPTOM_BIT[_LOCATION_SYMPTOMS[location]] if location in _LOCATION_SYMPTOMS else 0
+    )
+    for location in LOCATION_DISEASE_MAP
+)
+
+_PUNCTUATION_RE = re.compile(r'[,;:]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _scan_clinical_text(text_lower: str) -> int:
+    """Return the bitmask of every scan phrase contained in the text"""
+
+    found = 0
+    for match in _SCAN_RE.finditer(text_lower):
+        found |= _PHRASE_HITS[match.group(1)]
+    return found
+
+
 def enhance_symptom_extraction(
     text: str,
     base_symptoms: Dict[str, bool]
 ) -> Tuple[Dict[str, bool], List[Dict], Dict[str, List[str]]]:
-    """Enhanced symptom extraction with better preprocessing"""
+    """Enhanced symptom extraction with better preprocessing
+
+    Dict-based wrapper around the bit field extraction. The returned
+    symptom dict is only a new object when the extraction switched a
+    symptom on; otherwise base_symptoms itself is returned, so callers
+    must copy it before mutating.
+    """
 
     if not text or not isinstance(text, str):
         logger.warning("Invalid text input for symptom enhancement")
-        return base_symptoms.copy(), [], {}
+        return base_symptoms, [], {}
+
+    base_bits = to_bits(base_symptoms)
+    symptom_bits, matched_patterns, location_context = _cached_enhancement(
+        text, base_bits
+    )
+
+    enhanced = base_symptoms
+    added_bits = symptom_bits & ~base_bits
+    if added_bits:
+        enhanced = base_symptoms.copy()
+        for symptom in _bit_names(added_bits, SYMPTOM_TAGS):
+            enhanced[symptom] = True
+
+    # Hand out fresh containers so callers can't corrupt cached entries
+    return (
+        enhanced,
+        [
+            {
+                **pattern,
+                'evidence': {
+                    **pattern['evidence'],
+                    'symptoms': list(pattern['evidence']['symptoms']),
+                    'keywords': list(pattern['evidence']['keywords']),
+                }
+            }
+            for pattern in matched_patterns
+        ],
+        {location: list(diseases) for location, diseases in location_context}
+    )
+
+
+@lru_cache(maxsize=1024)
+def _cached_enhancement(
+    text: str,
+    symptom_bits: int
+) -> Tuple[int, Tuple[Dict, ...], Tuple[Tuple[str, Tuple[str, ...]], ...]]:
+    """Memoized extraction keyed on the raw text and the symptom bit field"""
+
+    symptom_bits, matched_patterns, location_context = extract_symptom_bits(
+        text, symptom_bits
+    )
+    return (
+        symptom_bits,
+        tuple(matched_patterns),
+        tuple(
+            (location, tuple(diseases))
+            for location, diseases in location_context.items()
+        )
+    )
+
+
+def extract_symptom_bits(
+    text: str,
+    symptom_bits: int
+) -> Tuple[int, List[Dict], Dict[str, List[str]]]:
+    """Location and pattern extraction over a symptom bit field"""
 
     # Preprocessing - make text more matchable
     text_lower = text.lower().strip()
 
     # Remove extra punctuation but keep important ones
-    text_lower = re.sub(r'[,;:]', ' ', text_lower)
-    text_lower = re.sub(r'\s+', ' ', text_lower)
+    text_lower = _PUNCTUATION_RE.sub(' ', text_lower)
+    text_lower = _WHITESPACE_RE.sub(' ', text_lower)
 
-    enhanced = base_symptoms.copy()
+    enhanced = symptom_bits
     matched_patterns: List[Dict] = []
     location_context: Dict[str, List[str]] = {}
 
     try:
+        found = _scan_clinical_text(text_lower)
+
         # Step 1: Check for anatomical locations
-        for location, associated_diseases in LOCATION_DISEASE_MAP.items():
-            if location in text_lower:
-                location_context[location] = associated_diseases
-                logger.debug(f"Detected anatomical location: {location}")
+        for location, location_bit, symptom_bit in _LOCATION_BITS:
+            if found & location_bit:
+                location_context[location] = LOCATION_DISEASE_MAP[location]
 
                 # Map location-specific symptoms
-                if 'rlq' in location or 'right lower quadrant' in location:
-                    enhanced['abdominal_pain_rlq'] = True
-                elif 'ruq' in location or 'right upper quadrant' in location:
-                    enhanced['abdominal_pain_ruq'] = True
-                elif 'llq' in location or 'left lower quadrant' in location:
-                    enhanced['abdominal_pain_llq'] = True
-                elif 'epigastric' in location:
-                    enhanced['epigastric_pain'] = True
+                enhanced |= symptom_bit
 
         # Step 2: Check for critical clinical patterns
-        for pattern_name, pattern_info in CRITICAL_PATTERNS.items():
+        min_symptoms = 2
+        min_keywords = 1
+
+        for index, pattern_name in enumerate(_P_NAMES):
+            symptom_hits = (enhanced & _P_SYM_MASKS[index]).bit_count()
+
+            # Skip the keyword check when the symptom threshold
+            # already rules this pattern out
+            if symptom_hits < min_symptoms:
+                continue
+
+            keyword_hits = (found & _P_KW_MASKS[index]).bit_count()
+            if keyword_hits < min_keywords:
+                continue
+
+            # Only matched patterns are hydrated back into dicts
+            pattern_info = CRITICAL_PATTERNS[pattern_name]
             symptoms_present = [
                 s for s in pattern_info['symptoms']
-                if enhanced.get(s, False)
+                if enhanced & SYMPTOM_BIT[s]
             ]
-
             keywords_present = [
-                k for k in pattern_info['keywords']
-                if k.lower() in text_lower
+                k for k, bit in _P_KW_BITS[index]
+                if found & bit
             ]
 
-            min_symptoms = 2
-            min_keywords = 1
-
-            if len(symptoms_present) >= min_symptoms and len(keywords_present) >= min_keywords:
-                matched_patterns.append({
-                    'pattern': pattern_name,
-                    'disease': pattern_info['disease'],
-                    'boost': pattern_info['boost'],
-                    'confidence': min(
-                        1.0,
-                        (len(symptoms_present) / len(pattern_info['symptoms'])) * 0.5 +
-                        (len(keywords_present) / len(pattern_info['keywords'])) * 0.5
-                    ),
-                    'evidence': {
-                        'symptoms': symptoms_present,
-                        'keywords': keywords_present,
-                        'description': pattern_info.get('description', '')
-                    }
-                })
-                logger.info(f"Matched clinical pattern: {pattern_name}")
+            matched_patterns.append({
+                'pattern': pattern_name,
+                'disease': pattern_info['disease'],
+                'boost': pattern_info['boost'],
+                'confidence': min(
+                    1.0,
+                    (symptom_hits / _P_SYM_COUNTS[index]) * 0.5 +
+                    (keyword_hits / _P_KW_COUNTS[index]) * 0.5
+                ),
+                'evidence': {
+                    'symptoms': symptoms_present,
+                    'keywords': keywords_present,
+                    'description': pattern_info.get('description', '')
+                }
+            })
+            logger.info("Matched clinical pattern: %s", pattern_name)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Detected locations=%s patterns=%s",
+                list(location_context),
+                [pattern['pattern'] for pattern in matched_patterns]
+            )
 
         return enhanced, matched_patterns, location_context
 
     except Exception as e:
         logger.error(f"Error in symptom enhancement: {e}", exc_info=True)
-        return base_symptoms.copy(), [], {}
+        return symptom_bits, [], {}
 
 
 def apply_pattern_boosts(
@@ -700,8 +1007,8 @@ def apply_pattern_boosts(
                 effective_boost = 1.0 + (boost - 1.0) * confidence
                 boosted[disease] *= effective_boost
                 logger.debug(
-                    f"Applied pattern boost to {disease}: "
-                    f"{boost:.2f}x (confidence: {confidence:.2f})"
+                    "Applied pattern boost to %s: %.2fx (confidence: %.2f)",
+                    disease, boost, confidence
                 )
 
         # Apply location-based boosts
@@ -711,8 +1018,8 @@ def apply_pattern_boosts(
                 if disease in boosted:
                     boosted[disease] *= location_boost
                     logger.debug(
-                        f"Applied location boost to {disease} "
-                        f"for {location}: {location_boost}x"
+                        "Applied location boost to %s for %s: %sx",
+                        disease, location, location_boost
                     )
 
         return boosted
@@ -726,6 +1033,11 @@ __all__ = [
     'MEDICAL_SYNONYMS',
     'LOCATION_DISEASE_MAP',
     'CRITICAL_PATTERNS',
+    'SYMPTOM_BIT',
+    'to_bits',
+    'from_bits',
     'enhance_symptom_extraction',
+    'extract_symptom_bits',
     'apply_pattern_boosts',
+    'build_phrase_regex',
 ]
@@ -21,15 +21,87 @@ adapted, and implemented by me as part of the final system.
 
 """
 from flask import redirect, render_template, session, request
-from functools import wraps
+from functools import wraps, lru_cache
+import atexit
+from bisect import bisect_right
 import json
+import queue
 import re
-from datetime import datetime, timedelta
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# orjson encodes audit details and decodes large consultation blobs several
+# times faster; fall back to the stdlib json module if it isn't installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Rows stored by json.dumps may hold NaN/Infinity, which orjson rejects
+            return json.loads(data)
+
+    def _json_dumps(obj) -> str:
+        # json.dumps coerces int keys to strings; keep that behaviour
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
+# Precompiled validation and sanitization patterns
+_CONTROL_TABLE = str.maketrans(dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+))
+
+# Potentially dangerous HTML/JS, fused so the text is scanned once.
+# RE2 (google-re2) guarantees linear-time scanning on adversarial input;
+# fall back to the stdlib engine if it isn't installed. Flags are inline
+# so the same pattern compiles under both.
+try:
+    import re2 as _sanitizer_re
+except ImportError:
+    _sanitizer_re = re
+
+# The two engines don't agree on what matches case-insensitively: stdlib re
+# folds the long s (U+017F) onto 's' and both dotted/dotless I (U+0130,
+# U+0131) onto 'i', RE2 only the long s. Spell those variants out, and give
+# RE2 a Unicode word class (its \w is ASCII-only), so either engine strips
+# the same text.
+_S = '[s\u017f]'
+_I = '[i\u0130\u0131]'
+
+
+def _compile_dangerous(engine):
+    word = r'\w' if engine is re else r'[\p{L}\p{N}_]'
+    patterns = [
+        rf'<{_S}cr{_I}pt[^>]*>.*?</{_S}cr{_I}pt>',
+        rf'java{_S}cr{_I}pt:',
+        rf'on{word}+\s*=',  # event handlers
+        rf'<{_I}frame',
+        r'<object',
+        r'<embed'
+    ]
+    return engine.compile(
+        '(?is)' + '|'.join(f'(?:{pattern})' for pattern in patterns)
+    )
+
+
+_DANGEROUS_RE = _compile_dangerous(_sanitizer_re)
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_PWD_LETTER_RE = re.compile(r'[a-zA-Z]')
+_PWD_DIGIT_RE = re.compile(r'\d')
+
 
 def login_required(f):
 
@@ -39,8 +111,8 @@ def login_required(f):
             logger.warning(f"Unauthorized access attempt to {request.path}")
             return redirect("/login")
 
-        # Update last activity
-        session['last_activity'] = datetime.utcnow().isoformat()
+        # Update last activity (epoch seconds)
+        session['last_activity'] = time.time()
 
         return f(*args, **kwargs)
     return decorated_function
@@ -86,6 +158,28 @@ def apology(message: str, code: int = 400):
 
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp string.
+
+    The 'YYYY-MM-DD HH:MM:SS' shape SQLite stores is sliced directly;
+    anything else (fractions, offsets, 'Z') goes through fromisoformat.
+    Listings repeat the same timestamps, so parses are memoized.
+    """
+    if (len(timestamp) == 19 and timestamp[4] == '-' and timestamp[7] == '-'
+            and timestamp[10] in ' T' and timestamp[13] == ':' and timestamp[16] == ':'):
+        try:
+            return datetime(
+                int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19])
+            )
+        except ValueError:
+            pass
+
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
 def format_timestamp(timestamp, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     """
     Format timestamp for display with timezone support
@@ -95,7 +189,7 @@ def format_timestamp(timestamp, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
 
     try:
         if isinstance(timestamp, str):
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            dt = _parse_iso(timestamp)
         else:
             dt = timestamp
 
@@ -110,9 +204,28 @@ def format_relative_time(timestamp) -> str:
     if not timestamp:
         return "Never"
 
+    if isinstance(timestamp, str):
+        return _format_relative_time_cached(timestamp, int(time.time() // 60))
+
+    return _format_relative_time(timestamp)
+
+
+@lru_cache(maxsize=4096)
+def _format_relative_time_cached(timestamp: str, minute_bucket: int) -> str:
+    """Relative time for a timestamp string, reused within the same minute"""
+    return _format_relative_time(timestamp)
+
+
+# Upper bounds (seconds) of the relative-time buckets and the unit used in each;
+# past the last bound the absolute date is shown instead
+_RELATIVE_TIME_BOUNDS = (60, 3600, 86400, 604800)
+_RELATIVE_TIME_UNITS = (None, (60, "minute"), (3600, "hour"), (86400, "day"))
+
+
+def _format_relative_time(timestamp) -> str:
     try:
         if isinstance(timestamp, str):
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            dt = _parse_iso(timestamp)
         else:
             dt = timestamp
 
@@ -121,19 +234,15 @@ def format_relative_time(timestamp) -> str:
 
         seconds = diff.total_seconds()
 
-        if seconds < 60:
+        bucket = bisect_right(_RELATIVE_TIME_BOUNDS, seconds)
+        if bucket == 0:
             return "Just now"
-        elif seconds < 3600:
-            mins = int(seconds / 60)
-            return f"{mins} minute{'s' if mins != 1 else ''} ago"
-        elif seconds < 86400:
-            hours = int(seconds / 3600)
-            return f"{hours} hour{'s' if hours != 1 else ''} ago"
-        elif seconds < 604800:
-            days = int(seconds / 86400)
-            return f"{days} day{'s' if days != 1 else ''} ago"
-        else:
+        if bucket == len(_RELATIVE_TIME_BOUNDS):
             return format_timestamp(dt, "%b %d, %Y")
+
+        divisor, unit = _RELATIVE_TIME_UNITS[bucket]
+        count = int(seconds / divisor)
+        return f"{count} {unit}{'s' if count != 1 else ''} ago"
     except Exception as e:
         logger.error(f"Relative time formatting error: {e}")
         return "Unknown"
@@ -151,14 +260,16 @@ def format_probability(prob: float) -> str:
     return f"{prob * 100:.2f}%"
 
 
+_CONFIDENCE_COLORS = MappingProxyType({
+    "HIGH": "success",
+    "MODERATE": "warning",
+    "LOW": "danger",
+    "VERY LOW": "danger"
+})
+
+
 def get_confidence_color(level: str) -> str:
-    colors = {
-        "HIGH": "success",
-        "MODERATE": "warning",
-        "LOW": "danger",
-        "VERY LOW": "danger"
-    }
-    return colors.get(level, "secondary")
+    return _CONFIDENCE_COLORS.get(level, "secondary")
 
 
 def get_urgency_color(urgency_score: int) -> str:
@@ -172,22 +283,38 @@ def get_urgency_color(urgency_score: int) -> str:
         return "secondary"
 
 
-def format_differential(differential: List[Dict]) -> List[Dict]:
-    formatted = []
-    for item in differential:
-        formatted.append({
-            'rank': item.get('rank', 0),
-            'disease': item['disease'],
-            'probability': item['probability'],
-            'probability_pct': f"{item['probability'] * 100:.1f}%",
-            'confidence': item['confidence'],
-            'confidence_color': get_confidence_color(item['confidence']),
-            'supporting_symptoms': item.get('supporting_symptoms', []),
-            'symptom_match_scores': item.get('symptom_match_scores', []),
-            'is_critical': item.get('is_critical', False),
-            'is_urgent': item.get('is_urgent', False)
-        })
-    return formatted
+@dataclass(slots=True)
+class DifferentialRow:
+    """One formatted differential diagnosis row for templates"""
+    rank: int
+    disease: str
+    probability: float
+    probability_pct: str
+    confidence: str
+    confidence_color: str
+    supporting_symptoms: List[str]
+    symptom_match_scores: List[Any]
+    is_critical: bool = False
+    is_urgent: bool = False
+
+
+def format_differential(differential: List[Dict]) -> List[DifferentialRow]:
+    colors = _CONFIDENCE_COLORS
+    return [
+        DifferentialRow(
+            item.get('rank', 0),
+            item['disease'],
+            item['probability'],
+            '%.1f%%' % (item['probability'] * 100),
+            item['confidence'],
+            colors.get(item['confidence'], "secondary"),
+            item.get('supporting_symptoms', []),
+            item.get('symptom_match_scores', []),
+            item.get('is_critical', False),
+            item.get('is_urgent', False)
+        )
+        for item in differential
+    ]
 
 
 
@@ -198,7 +325,7 @@ def sanitize_input(text: str, max_length: int = 5000) -> str:
         return ""
 
     # Remove control characters
-    text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+    text = text.translate(_CONTROL_TABLE)
 
     # Remove excessive whitespace
     text = " ".join(text.split())
@@ -206,18 +333,17 @@ def sanitize_input(text: str, max_length: int = 5000) -> str:
     # Limit length
     text = text[:max_length]
 
-    # Remove potentially dangerous HTML/JS
-    dangerous_patterns = [
-        r'<script[^>]*>.*?</script>',
-        r'javascript:',
-        r'on\w+\s*=',  # event handlers
-        r'<iframe',
-        r'<object',
-        r'<embed'
-    ]
+    # Every dangerous pattern needs '<', '=' or ':' - most input has none of
+    # them and can skip the regex entirely. Don't narrow this to a lowercase
+    # 'javascript:' check: the regex also matches case-folded variants.
+    if '<' not in text and '=' not in text and ':' not in text:
+        return text.strip()
 
-    for pattern in dangerous_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
+    # Remove potentially dangerous HTML/JS - repeat until nothing matches
+    # so removals can't splice together a new dangerous fragment
+    removed = 1
+    while removed:
+        text, removed = _DANGEROUS_RE.subn('', text)
 
     return text.strip()
 
@@ -226,8 +352,7 @@ def validate_email(email: str) -> bool:
     """Validate email format"""
     if not email:
         return False
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_username(username: str) -> tuple[bool, str]:
@@ -238,7 +363,7 @@ def validate_username(username: str) -> tuple[bool, str]:
         return False, "Username must be at least 3 characters"
     if len(username) > 50:
         return False, "Username must be less than 50 characters"
-    if not re.match(r'^[a-zA-Z0-9_-]+$', username):
+    if not _USERNAME_RE.match(username):
         return False, "Username can only contain letters, numbers, hyphens, and underscores"
     return True, ""
 
@@ -253,8 +378,8 @@ def validate_password(password: str) -> tuple[bool, str]:
         return False, "Password too long"
 
     # Check for basic complexity
-    has_letter = bool(re.search(r'[a-zA-Z]', password))
-    has_number = bool(re.search(r'\d', password))
+    has_letter = bool(_PWD_LETTER_RE.search(password))
+    has_number = bool(_PWD_DIGIT_RE.search(password))
 
     if not (has_letter and has_number):
         return False, "Password must contain both letters and numbers"
@@ -263,6 +388,17 @@ def validate_password(password: str) -> tuple[bool, str]:
 
 
 
+# Audit writes are queued and inserted in batches by a background thread,
+# keeping the SELECT/INSERT round-trips out of the request path
+_AUDIT_QUEUE: "queue.Queue[tuple]" = queue.Queue(maxsize=10000)
+_AUDIT_BATCH_SIZE = 50  # 50 rows x 11 columns stays under SQLite's 999-variable limit
+_AUDIT_FLUSH_INTERVAL = 0.05  # seconds
+_AUDIT_COLUMNS = 11
+_audit_worker_lock = threading.Lock()
+_audit_write_lock = threading.Lock()  # worker and exit flush share one connection
+_audit_worker: Optional[threading.Thread] = None
+
+
 def log_audit(db, user_id: Optional[int], action: str,
              details: Optional[Dict] = None,
              severity: str = "info",
@@ -279,52 +415,222 @@ def log_audit(db, user_id: Optional[int], action: str,
         # Categorize action
         category = categorize_action(action)
 
-        # Get username for denormalization
-        username = None
-        if user_id:
-            try:
-                user = db.execute("SELECT username FROM users WHERE id = ?", user_id)
-                if user:
-                    username = user[0]['username']
-            except:
-                pass
-
-        # Insert audit log
-        db.execute("""
-            INSERT INTO audit_log (
-                user_id, username, action, action_category,
-                details, severity, ip_address, user_agent,
-                request_method, request_path
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            user_id, username, action, category,
-            json.dumps(details) if details else None,
+        # Username is resolved by the worker; the timestamp is taken now
+        # so batching doesn't shift when the event happened
+        record = (
+            user_id, action, category,
+            _json_dumps(details) if details else None,
             severity, ip_address, user_agent,
             request.method if request else None,
-            request.path if request else None
+            request.path if request else None,
+            datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         )
 
+        _ensure_audit_worker(db)
+        try:
+            _AUDIT_QUEUE.put_nowait(record)
+        except queue.Full:
+            # Never drop audit records - write this one synchronously
+            _process_audit_items(db, [record])
+
         logger.debug(f"Audit log: {action} by user {user_id}")
 
     except Exception as e:
         logger.error(f"Audit logging error: {e}")
 
 
+def _ensure_audit_worker(db):
+    """Start the audit writer thread on first use"""
+    global _audit_worker
+    if _audit_worker is not None:
+        return
+
+    with _audit_worker_lock:
+        if _audit_worker is None:
+            _audit_worker = threading.Thread(
+                target=_run_audit_worker, args=(db,),
+                name="audit-writer", daemon=True
+            )
+            _audit_worker.start()
+            atexit.register(flush_audit_log, db)
+
+
+def _run_audit_worker(db):
+    """Drain the audit queue in batches of up to _AUDIT_BATCH_SIZE"""
+    while True:
+        batch = [_AUDIT_QUEUE.get()]
+        deadline = time.monotonic() + _AUDIT_FLUSH_INTERVAL
+
+        while len(batch) < _AUDIT_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_AUDIT_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            _process_audit_items(db, batch)
+        finally:
+            # Lets flush_audit_log() wait for batches already taken off the queue
+            for _ in batch:
+                _AUDIT_QUEUE.task_done()
+
+
+def flush_audit_log(db):
+    """Synchronously write queued audit records and wait for the worker's in-flight batch"""
+    batch = []
+    while True:
+        try:
+            batch.append(_AUDIT_QUEUE.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        try:
+            _process_audit_items(db, batch)
+        finally:
+            for _ in batch:
+                _AUDIT_QUEUE.task_done()
+
+    # The daemon worker is only killed after atexit handlers return, so a
+    # batch it has already dequeued is waited for here rather than lost
+    worker = _audit_worker
+    if worker is not None and worker.is_alive() and worker is not threading.current_thread():
+        _AUDIT_QUEUE.join()
+
+
+def _process_audit_items(db, batch: List[Any]):
+    """Write queued audit records, then run any background jobs queued with them"""
+    records = [item for item in batch if not callable(item)]
+
+    # Outside an app context the worker and the exit flush use the CS50
+    # wrapper's single connection, so their writes must not interleave
+    with _audit_write_lock:
+        if records:
+            _write_audit_batch(db, records)
+
+        for job in batch:
+            if callable(job):
+                try:
+                    job()
+                except Exception as e:
+                    logger.error(f"Background job error: {e}")
+
+
+@lru_cache(maxsize=512)
+def _cached_username(db, user_id: int) -> str:
+    """Username lookup memoized on hits only (usernames never change)"""
+    user = db.execute("SELECT username FROM users WHERE id = ?", user_id)
+    if not user:
+        # lru_cache doesn't store exceptions, so a user row that isn't
+        # visible yet is looked up again next time instead of cached as None
+        raise LookupError(user_id)
+    return user[0]['username']
+
+
+def _lookup_username(db, user_id: int) -> Optional[str]:
+    """Get username for denormalization"""
+    try:
+        return _cached_username(db, user_id)
+    except LookupError:
+        return None
+
+
+def _write_audit_batch(db, batch: List[tuple]):
+    """Insert queued audit records with one multi-row INSERT"""
+    rows = []
+    for user_id, *fields in batch:
+        username = None
+        if user_id:
+            try:
+                username = _lookup_username(db, user_id)
+            except Exception:
+                pass
+        rows.append((user_id, username, *fields))
+
+    insert = """
+        INSERT INTO audit_log (
+            user_id, username, action, action_category,
+            details, severity, ip_address, user_agent,
+            request_method, request_path, timestamp
+        ) VALUES """
+
+    try:
+        placeholders = ", ".join(["(" + ", ".join("?" * _AUDIT_COLUMNS) + ")"] * len(rows))
+        db.execute(insert + placeholders, *[value for row in rows for value in row])
+    except Exception as e:
+        # One bad row fails the whole statement - retry individually
+        logger.warning(f"Audit batch insert failed, retrying per row: {e}")
+        single = "(" + ", ".join("?" * _AUDIT_COLUMNS) + ")"
+        for row in rows:
+            try:
+                db.execute(insert + single, *row)
+            except Exception as e:
+                logger.error(f"Audit logging error: {e}")
+
+
+_ACTION_CATEGORIES = MappingProxyType({
+    'login': 'auth',
+    'logout': 'auth',
+    'register': 'auth',
+    'accept_disclaimer': 'auth',
+    'diagnostic_query': 'query',
+    'export_consultation': 'data',
+    'view_consultation': 'access',
+    'user_enabled': 'admin',
+    'user_disabled': 'admin',
+})
+
+
 def categorize_action(action: str) -> str:
     """Categorize audit action"""
-    categories = {
-        'login': 'auth',
-        'logout': 'auth',
-        'register': 'auth',
-        'accept_disclaimer': 'auth',
-        'diagnostic_query': 'query',
-        'export_consultation': 'data',
-        'view_consultation': 'access',
-        'user_enabled': 'admin',
-        'user_disabled': 'admin',
-    }
-    return categories.get(action, 'other')
+    return _ACTION_CATEGORIES.get(action, 'other')
+
+
 
+# Persistent: stored in the database file, so setting it once covers every connection
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",      # readers no longer block audit writes
+)
+
+# Per-connection: must be applied to every connection the pool opens
+_SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",    # safe under WAL, avoids an fsync per commit
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+def configure_sqlite(db) -> None:
+    """Enable WAL on the app database and apply per-connection pragmas to every connection"""
+    for pragma in _SQLITE_PRAGMAS + _SQLITE_CONNECTION_PRAGMAS:
+        try:
+            db.execute(pragma)
+        except Exception as e:
+            logger.warning(f"Could not apply '{pragma}': {e}")
+
+    # Request handlers get fresh pooled connections, so hook connection
+    # creation on the CS50 wrapper's SQLAlchemy engine as cs50 itself does
+    engine = getattr(db, "_engine", None)
+    if engine is None:
+        logger.warning("No SQLAlchemy engine on db; per-connection pragmas not registered")
+        return
+
+    try:
+        from sqlalchemy import event
+        event.listen(engine, "connect", _apply_connection_pragmas)
+    except Exception as e:
+        logger.warning(f"Could not register per-connection pragmas: {e}")
+
+
+def _apply_connection_pragmas(dbapi_connection, connection_record) -> None:
+    """SQLAlchemy 'connect' hook: run the per-connection pragmas on a new DB-API connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_CONNECTION_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
 
 def check_disclaimer_acceptance(db, user_id: int) -> bool:
@@ -367,38 +673,41 @@ def record_disclaimer_acceptance(db, user_id: int,
 
 
 
+_SESSION_TIMEOUT = 7200  # 2 hour timeout, in seconds
+
+
 def is_session_expired() -> bool:
     """Check if user session has expired"""
     last_activity = session.get('last_activity')
-    if not last_activity:
+    # Missing, or an ISO string left by an older session - treat as expired
+    if not isinstance(last_activity, (int, float)) or not last_activity:
         return True
 
-    try:
-        last_dt = datetime.fromisoformat(last_activity)
-        timeout = timedelta(hours=2)  # 2 hour timeout
-        return (datetime.utcnow() - last_dt) > timeout
-    except:
-        return True
+    return (time.time() - last_activity) > _SESSION_TIMEOUT
 
 
 def refresh_session():
     """Refresh session timestamp"""
-    session['last_activity'] = datetime.utcnow().isoformat()
+    session['last_activity'] = time.time()
     session.modified = True
 
 
+_EXPORT_DROP_FIELDS = frozenset({'user_id', 'ip_address', 'session_id'})
+_EXPORT_JSON_FIELDS = ('symptoms_detected', 'response', 'differential_diagnosis')
+
+
 def prepare_export_data(consultation: Dict) -> Dict:
     """Prepare consultation data for export"""
     # Remove sensitive fields
     export_data = {k: v for k, v in consultation.items()
-                   if k not in ['user_id', 'ip_address', 'session_id']}
+                   if k not in _EXPORT_DROP_FIELDS}
 
     # Parse JSON fields
-    json_fields = ['symptoms_detected', 'response', 'differential_diagnosis']
-    for field in json_fields:
-        if field in export_data and isinstance(export_data[field], str):
+    for field in _EXPORT_JSON_FIELDS:
+        value = export_data.get(field)
+        if isinstance(value, str):
             try:
-                export_data[field] = json.loads(export_data[field])
+                export_data[field] = _json_loads(value)
             except:
                 pass
 
@@ -411,40 +720,23 @@ def calculate_user_stats(db, user_id: int) -> Dict:
     stats = {}
 
     try:
-        # Total consultations
-        result = db.execute(
-            "SELECT COUNT(*) as count FROM consultations WHERE user_id = ?",
-            user_id
-        )
-        stats['total_consultations'] = result[0]['count'] if result else 0
-
-        # This week
-        result = db.execute("""
-            SELECT COUNT(*) as count FROM consultations
-            WHERE user_id = ? AND timestamp >= datetime('now', '-7 days')
-        """, user_id)
-        stats['consultations_this_week'] = result[0]['count'] if result else 0
-
-        # This month
-        result = db.execute("""
-            SELECT COUNT(*) as count FROM consultations
-            WHERE user_id = ? AND timestamp >= datetime('now', '-30 days')
-        """, user_id)
-        stats['consultations_this_month'] = result[0]['count'] if result else 0
-
-        # Urgent cases
-        result = db.execute("""
-            SELECT COUNT(*) as count FROM consultations
-            WHERE user_id = ? AND is_urgent = 1
-        """, user_id)
-        stats['urgent_cases'] = result[0]['count'] if result else 0
-
-        # Average confidence
+        # Counts and average in one range scan of idx_consultations_user_stats
         result = db.execute("""
-            SELECT AVG(confidence_score) as avg FROM consultations
+            SELECT COUNT(*) as total,
+                   COUNT(CASE WHEN timestamp >= datetime('now', '-7 days') THEN 1 END) as this_week,
+                   COUNT(CASE WHEN timestamp >= datetime('now', '-30 days') THEN 1 END) as this_month,
+                   COUNT(CASE WHEN is_urgent = 1 THEN 1 END) as urgent,
+                   AVG(confidence_score) as avg
+            FROM consultations
             WHERE user_id = ?
         """, user_id)
-        stats['avg_confidence'] = round(result[0]['avg'], 3) if result and result[0]['avg'] else 0
+        row = result[0] if result else {}
+
+        stats['total_consultations'] = row.get('total') or 0
+        stats['consultations_this_week'] = row.get('this_week') or 0
+        stats['consultations_this_month'] = row.get('this_month') or 0
+        stats['urgent_cases'] = row.get('urgent') or 0
+        stats['avg_confidence'] = round(row['avg'], 3) if row.get('avg') else 0
 
         # Most common diagnoses
         result = db.execute("""
@@ -463,36 +755,93 @@ def calculate_user_stats(db, user_id: int) -> Dict:
     return stats
 
 
+# System stats change slowly; they are served from the stats_cache table
+# and recomputed on the audit worker thread once older than the TTL
+_STATS_CACHE_TTL = 60  # seconds
+_SYSTEM_STATS_KEYS = (
+    'total_users', 'active_users_7d', 'total_consultations',
+    'consultations_today', 'avg_confidence'
+)
+_stats_refresh_pending = threading.Event()
+
+
 def calculate_system_stats(db) -> Dict:
     """Calculate system-wide statistics"""
-    stats = {}
+    try:
+        rows = db.execute(
+            "SELECT key, value, updated_at >= datetime('now', ?) as fresh FROM stats_cache",
+            f"-{_STATS_CACHE_TTL} seconds"
+        )
+        cached = {row['key']: row for row in rows}
+        if all(key in cached for key in _SYSTEM_STATS_KEYS):
+            if not all(cached[key]['fresh'] for key in _SYSTEM_STATS_KEYS):
+                _schedule_system_stats_refresh(db)
+            return {key: cached[key]['value'] for key in _SYSTEM_STATS_KEYS}
+    except Exception as e:
+        logger.warning(f"Stats cache unavailable: {e}")
+
+    # Nothing cached yet - compute inline this once
+    return _refresh_system_stats(db)
+
+
+def _schedule_system_stats_refresh(db):
+    """Queue one stats refresh on the audit worker; stale values are served meanwhile"""
+    if _stats_refresh_pending.is_set():
+        return
+    _stats_refresh_pending.set()
 
+    _ensure_audit_worker(db)
     try:
-        # Total users
-        result = db.execute("SELECT COUNT(*) as count FROM users")
-        stats['total_users'] = result[0]['count'] if result else 0
+        _AUDIT_QUEUE.put_nowait(lambda: _refresh_system_stats(db))
+    except queue.Full:
+        _stats_refresh_pending.clear()
 
-        # Active users (last 7 days)
-        result = db.execute("""
-            SELECT COUNT(*) as count FROM users
-            WHERE last_login >= datetime('now', '-7 days')
-        """)
-        stats['active_users_7d'] = result[0]['count'] if result else 0
 
-        # Total consultations
-        result = db.execute("SELECT COUNT(*) as count FROM consultations")
-        stats['total_consultations'] = result[0]['count'] if result else 0
+def _refresh_system_stats(db) -> Dict:
+    """Recompute system stats and store them in stats_cache"""
+    stats = {}
+    try:
+        stats = _compute_system_stats(db)
+        if all(key in stats for key in _SYSTEM_STATS_KEYS):
+            placeholders = ", ".join(["(?, ?, CURRENT_TIMESTAMP)"] * len(_SYSTEM_STATS_KEYS))
+            db.execute(
+                "INSERT OR REPLACE INTO stats_cache (key, value, updated_at) VALUES " + placeholders,
+                *[value for key in _SYSTEM_STATS_KEYS for value in (key, stats[key])]
+            )
+    except Exception as e:
+        logger.warning(f"Stats cache refresh failed: {e}")
+    finally:
+        _stats_refresh_pending.clear()
+
+    return stats
 
-        # Today's consultations
+
+def _compute_system_stats(db) -> Dict:
+    """Run the system-wide statistics queries"""
+    stats = {}
+
+    try:
+        # Total and active users (last 7 days)
         result = db.execute("""
-            SELECT COUNT(*) as count FROM consultations
-            WHERE DATE(timestamp) = DATE('now')
+            SELECT COUNT(*) as total,
+                   COUNT(CASE WHEN last_login >= datetime('now', '-7 days') THEN 1 END) as active
+            FROM users
         """)
-        stats['consultations_today'] = result[0]['count'] if result else 0
+        row = result[0] if result else {}
+        stats['total_users'] = row.get('total') or 0
+        stats['active_users_7d'] = row.get('active') or 0
 
-        # Average confidence
-        result = db.execute("SELECT AVG(confidence_score) as avg FROM consultations")
-        stats['avg_confidence'] = round(result[0]['avg'], 3) if result and result[0]['avg'] else 0
+        # Total, today's and average confidence
+        result = db.execute("""
+            SELECT COUNT(*) as total,
+                   COUNT(CASE WHEN DATE(timestamp) = DATE('now') THEN 1 END) as today,
+                   AVG(confidence_score) as avg
+            FROM consultations
+        """)
+        row = result[0] if result else {}
+        stats['total_consultations'] = row.get('total') or 0
+        stats['consultations_today'] = row.get('today') or 0
+        stats['avg_confidence'] = round(row['avg'], 3) if row.get('avg') else 0
 
     except Exception as e:
         logger.error(f"System stats error: {e}")
@@ -511,7 +860,7 @@ def parse_json_safe(json_str: str, default=None):
     if not json_str:
         return default
     try:
-        return json.loads(json_str)
+        return _json_loads(json_str)
     except:
         return default
 
@@ -533,11 +882,13 @@ __all__ = [
     'format_relative_time',
     'format_confidence',
     'format_differential',
+    'DifferentialRow',
     'sanitize_input',
     'validate_email',
     'validate_username',
     'validate_password',
     'log_audit',
+    'configure_sqlite',
     'check_disclaimer_acceptance',
     'record_disclaimer_acceptance',
     'calculate_user_stats',
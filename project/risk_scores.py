@@ -20,17 +20,19 @@ All code included in this repository was either written by me or reviewed,
 adapted, and implemented by me as part of the final system.
 
 """
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 import logging
+from math import log
+from functools import lru_cache, wraps
 
 logger = logging.getLogger(__name__)
 
 
-class RiskLevel(Enum):
-    """Risk level categorization"""
+class RiskLevel(StrEnum):
+    """Risk level categorization (members are their string values)"""
     MINIMAL = "minimal"
     LOW = "low"
     MODERATE = "moderate"
@@ -40,7 +42,35 @@ class RiskLevel(Enum):
 
 
 
-@dataclass
+class _LazyDetail:
+    """
+    Score detail text, formatted only when rendered. Deliberately not a
+    tuple, so an unrendered detail can't pass for data (json.dumps rejects
+    it rather than emitting a list); use str(), to_dict() or render_details.
+    """
+    __slots__ = ('template', 'args')
+
+    def __init__(self, template: str, args: Tuple[Any, ...]):
+        self.template = template
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.template.format(*self.args)
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+
+def _render_details(details: Dict[str, Any]) -> Dict[str, Any]:
+    """Format any lazy detail values into plain strings"""
+    return {
+        name: str(value) if isinstance(value, _LazyDetail) else value
+        for name, value in details.items()
+    }
+
+
+
+@dataclass(slots=True)
 class ScoreResult:
     """Generic score result"""
     score: int
@@ -52,15 +82,316 @@ class ScoreResult:
     score_details: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'score': self.score,
-            'max_score': self.max_score,
-            'risk_level': self.risk_level.value,
-            'interpretation': self.interpretation,
-            'recommendations': self.recommendations,
-            'missing_data': self.missing_data,
-            'score_details': self.score_details
-        }
+        result = {name: getattr(self, name) for name in _SCORE_RESULT_FIELDS}
+        result['score_details'] = _render_details(self.score_details)
+        return result
+
+
+_SCORE_RESULT_FIELDS = tuple(f.name for f in fields(ScoreResult))
+
+
+
+# Risk level and interpretation for each score band. The band functions are
+# evaluated once per possible score at import; calculators index the tables.
+def _qsofa_band(score: int) -> Tuple[RiskLevel, str]:
+    if score >= 2:
+        return RiskLevel.HIGH, "High risk for poor outcomes. Sepsis workup indicated."
+    elif score == 1:
+        return RiskLevel.MODERATE, "Moderate risk. Consider sepsis evaluation."
+    else:
+        return RiskLevel.LOW, "Low risk for sepsis-related adverse outcomes."
+
+
+def _nihss_band(score: int) -> Tuple[RiskLevel, str]:
+    if score == 0:
+        return RiskLevel.MINIMAL, "No stroke symptoms detected"
+    elif score <= 4:
+        return RiskLevel.LOW, "Minor stroke"
+    elif score <= 15:
+        return RiskLevel.MODERATE, "Moderate stroke"
+    elif score <= 20:
+        return RiskLevel.HIGH, "Moderate to severe stroke"
+    else:
+        return RiskLevel.VERY_HIGH, "Severe stroke"
+
+
+# Annual stroke risk by CHA₂DS₂-VASc score, for the scores quoted in the bands
+_CHA2DS2VASC_STROKE_RISK = {2: "2.2%", 3: "3.2%", 4: "4.8%", 5: "7.2%"}
+
+
+def _cha2ds2vasc_band(score: int) -> Tuple[RiskLevel, str]:
+    if score == 0:
+        return RiskLevel.LOW, "Low risk (0.2% annual stroke risk)"
+    elif score == 1:
+        return RiskLevel.LOW, "Low-moderate risk (0.6% annual stroke risk)"
+    elif score <= 3:
+        return RiskLevel.MODERATE, f"Moderate risk ({_CHA2DS2VASC_STROKE_RISK[score]} annual stroke risk)"
+    elif score <= 5:
+        return RiskLevel.HIGH, f"High risk ({_CHA2DS2VASC_STROKE_RISK[score]} annual stroke risk)"
+    else:
+        return RiskLevel.VERY_HIGH, f"Very high risk (>9% annual stroke risk)"
+
+
+def _curb65_band(score: int) -> Tuple[RiskLevel, str]:
+    if score <= 1:
+        return RiskLevel.LOW, "Low severity - suitable for outpatient treatment"
+    elif score == 2:
+        return RiskLevel.MODERATE, "Moderate severity - consider hospitalization"
+    else:
+        return RiskLevel.HIGH, f"High severity (score {score}) - hospitalize, consider ICU"
+
+
+def _meld_band(score: int) -> Tuple[RiskLevel, str]:
+    if score < 10:
+        return RiskLevel.LOW, f"MELD {score}: 1.9% 90-day mortality"
+    elif score < 20:
+        return RiskLevel.MODERATE, f"MELD {score}: ~6% 90-day mortality"
+    elif score < 30:
+        return RiskLevel.HIGH, f"MELD {score}: ~20% 90-day mortality"
+    elif score < 40:
+        return RiskLevel.VERY_HIGH, f"MELD {score}: ~53% 90-day mortality"
+    else:
+        return RiskLevel.CRITICAL, f"MELD {score}: >70% 90-day mortality"
+
+
+def _gcs_band(score: int) -> Tuple[RiskLevel, str]:
+    if score >= 13:
+        return RiskLevel.LOW, f"GCS {score}: Mild impairment"
+    elif score >= 9:
+        return RiskLevel.MODERATE, f"GCS {score}: Moderate impairment"
+    else:
+        return RiskLevel.CRITICAL, f"GCS {score}: Severe impairment"
+
+
+def _score_table(band, max_score: int) -> Tuple[Tuple[RiskLevel, str], ...]:
+    return tuple(band(score) for score in range(max_score + 1))
+
+
+def _lookup_band(table, band, score) -> Tuple[RiskLevel, str]:
+    """Precomputed entry for in-range integer scores, band() for anything else"""
+    if isinstance(score, int) and 0 <= score < len(table):
+        return table[score]
+    return band(score)
+
+
+_QSOFA_BANDS = _score_table(_qsofa_band, 3)
+_NIHSS_BANDS = _score_table(_nihss_band, 42)
+_CHA2DS2VASC_BANDS = _score_table(_cha2ds2vasc_band, 9)
+_CURB65_BANDS = _score_table(_curb65_band, 5)
+_MELD_BANDS = _score_table(_meld_band, 40)
+_GCS_BANDS = _score_table(_gcs_band, 15)
+
+# Risk level alone per score, for the batch scorers
+_QSOFA_LEVELS = tuple(level for level, _ in _QSOFA_BANDS)
+_CHA2DS2VASC_LEVELS = tuple(level for level, _ in _CHA2DS2VASC_BANDS)
+_CURB65_LEVELS = tuple(level for level, _ in _CURB65_BANDS)
+
+# Inputs behind each bit of a batch scorer's missing-data mask: bit i is set
+# when QSOFA_MISSING_FIELDS[i] is missing. Names and order match the single
+# patient ScoreResult.missing_data.
+QSOFA_MISSING_FIELDS = ('respiratory_rate', 'gcs_score', 'systolic_bp')
+CHA2DS2VASC_MISSING_FIELDS = ('age', 'sex')
+CURB65_MISSING_FIELDS = ('urea', 'respiratory_rate', 'blood_pressure', 'age')
+MELD_MISSING_FIELDS = ('creatinine', 'bilirubin', 'INR')
+
+
+def missing_fields(mask: int, names: Tuple[str, ...]) -> List[str]:
+    """Decode a batch missing-data mask against one of the *_MISSING_FIELDS tuples"""
+    return [name for bit, name in enumerate(names) if mask >> bit & 1]
+
+
+
+
+# Recommendation templates per score band; calculators copy the one they
+# need and append any missing-data note
+_QSOFA_RECS = (
+    (),
+    (
+        "Monitor closely for sepsis progression",
+        "Reassess qSOFA with each vital signs check",
+        "Consider infection workup",
+    ),
+    (
+        "🚨 qSOFA ≥2: High risk for sepsis",
+        "Obtain blood cultures before antibiotics",
+        "Start broad-spectrum antibiotics within 1 hour",
+        "Measure lactate level",
+        "Consider ICU consultation",
+    ),
+)
+
+_NIHSS_STROKE_RECS = (
+    "🚨 Stroke detected - activate stroke protocol",
+    "CT head STAT (rule out hemorrhage)",
+    "Check time of symptom onset (thrombolysis window)",
+)
+_NIHSS_MINOR_RECS = _NIHSS_STROKE_RECS + (
+    "May be candidate for outpatient management if stable",
+)
+_NIHSS_SEVERE_RECS = _NIHSS_STROKE_RECS + (
+    "Consider thrombectomy evaluation",
+    "Neurology/stroke team consultation STAT",
+)
+
+_CHA2DS2VASC_REASSESS = "Reassess score annually and with status changes"
+_CHA2DS2VASC_HIGH_RECS = (
+    "🩸 Anticoagulation recommended (unless contraindicated)",
+    "Options: Warfarin (INR 2-3) or DOAC (apixaban, rivaroxaban, etc.)",
+    _CHA2DS2VASC_REASSESS,
+)
+_CHA2DS2VASC_SEX_ONLY_RECS = (
+    "Consider anticoagulation vs. aspirin (shared decision making)",
+    _CHA2DS2VASC_REASSESS,
+)
+_CHA2DS2VASC_ONE_RECS = (
+    "Anticoagulation recommended for most patients",
+    _CHA2DS2VASC_REASSESS,
+)
+_CHA2DS2VASC_LOW_RECS = (
+    "Low risk - anticoagulation generally not recommended",
+    _CHA2DS2VASC_REASSESS,
+)
+
+_CURB65_LOW_RECS = (
+    "✓ Low risk - outpatient treatment appropriate",
+    "Oral antibiotics (e.g., amoxicillin, doxycycline, or macrolide)",
+    "Close follow-up in 48-72 hours",
+)
+_CURB65_MODERATE_RECS = (
+    "⚠️ Moderate risk - hospitalization vs. close outpatient monitoring",
+    "Consider additional risk factors and social circumstances",
+)
+_CURB65_HIGH_RECS = (
+    "🚨 High risk - hospitalize immediately",
+    "IV antibiotics (e.g., ceftriaxone + azithromycin)",
+    "Chest X-ray, blood cultures, CBC, BMP",
+)
+_CURB65_RECS = (
+    _CURB65_LOW_RECS,
+    _CURB65_LOW_RECS,
+    _CURB65_MODERATE_RECS,
+    _CURB65_HIGH_RECS,
+    _CURB65_HIGH_RECS + ("Consider ICU admission",),
+    _CURB65_HIGH_RECS + ("Consider ICU admission",),
+)
+
+_MELD_RECALCULATE = "Recalculate MELD regularly (weekly-monthly depending on score)"
+_MELD_LOW_RECS = (_MELD_RECALCULATE,)
+_MELD_HIGH_RECS = (
+    "⚠️ High MELD score - transplant evaluation indicated",
+    "Hepatology/transplant surgery consultation",
+    _MELD_RECALCULATE,
+)
+_MELD_CRITICAL_RECS = _MELD_HIGH_RECS[:-1] + (
+    "🚨 Critical MELD score - urgent transplant consideration",
+    "ICU-level monitoring may be required",
+    _MELD_RECALCULATE,
+)
+
+_GCS_SEVERE_RECS = (
+    "🚨 GCS ≤8: Consider airway protection (intubation)",
+    "CT head STAT",
+    "Neurosurgery/neurology consultation",
+    "ICU admission",
+)
+_GCS_MODERATE_RECS = (
+    "⚠️ Moderate impairment - close monitoring required",
+    "Frequent neuro checks (q1-2h)",
+)
+
+
+
+
+def _meld_score(creatinine: float, bilirubin: float, inr: float, dialysis_twice: bool) -> int:
+    """MELD formula: floor labs at 1.0, log-linear combination, round and cap to 6-40"""
+    # Apply floor values
+    creat = max(1.0, creatinine)
+    bili = max(1.0, bilirubin)
+    inr_val = max(1.0, inr)
+
+    # If on dialysis twice in past week, use creatinine = 4.0
+    if dialysis_twice:
+        creat = 4.0
+
+    raw_score = (
+        10 * (
+            0.957 * log(creat) +
+            0.378 * log(bili) +
+            1.120 * log(inr_val) +
+            0.643
+        )
+    )
+
+    # Round and cap
+    return max(6, min(40, round(raw_score)))
+
+
+
+
+# NIHSS item names, in calculate_nihss() parameter order
+_NIHSS_ITEMS = (
+    'LOC Questions',
+    'LOC Commands',
+    'Gaze',
+    'Visual Fields',
+    'Facial Palsy',
+    'Motor Left Arm',
+    'Motor Right Arm',
+    'Motor Left Leg',
+    'Motor Right Leg',
+    'Ataxia',
+    'Sensory',
+    'Language',
+    'Dysarthria',
+    'Extinction/Inattention',
+)
+
+
+
+
+def _copy_result(result: ScoreResult) -> ScoreResult:
+    """Copy with fresh containers, so callers can't alter a cached result"""
+    return ScoreResult(
+        score=result.score,
+        max_score=result.max_score,
+        risk_level=result.risk_level,
+        interpretation=result.interpretation,
+        recommendations=list(result.recommendations),
+        missing_data=list(result.missing_data),
+        score_details=dict(result.score_details)
+    )
+
+
+def _memoized(impl):
+    """
+    Cache a calculator implementation's result per argument tuple. The
+    implementations are static and pure, so one cache serves every
+    instance. typed=True keeps e.g. 22 and 22.0 apart, since they render
+    differently in the score details.
+    """
+    cached = lru_cache(maxsize=512, typed=True)(impl)
+
+    @wraps(impl)
+    def wrapper(*args, **kwargs) -> ScoreResult:
+        # Check hashability on its own, so a TypeError raised inside the
+        # calculation itself propagates instead of triggering a second run
+        try:
+            hash((args, frozenset(kwargs.items())))
+        except TypeError:  # unhashable argument - compute directly
+            return impl(*args, **kwargs)
+        return _copy_result(cached(*args, **kwargs))
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _finish(result: ScoreResult, render_details: bool) -> ScoreResult:
+    """Render score details eagerly for UI callers that opt in"""
+    if render_details:
+        result.score_details = _render_details(result.score_details)
+    return result
+
 
 
 
@@ -75,7 +406,21 @@ class RiskScoreCalculator:
         self,
         systolic_bp: Optional[int] = None,
         respiratory_rate: Optional[int] = None,
-        gcs_score: Optional[int] = None
+        gcs_score: Optional[int] = None,
+        render_details: bool = False
+    ) -> ScoreResult:
+
+        return _finish(
+            self._qsofa_impl(systolic_bp, respiratory_rate, gcs_score),
+            render_details
+        )
+
+    @staticmethod
+    @_memoized
+    def _qsofa_impl(
+        systolic_bp: Optional[int],
+        respiratory_rate: Optional[int],
+        gcs_score: Optional[int]
     ) -> ScoreResult:
 
         score = 0
@@ -86,9 +431,9 @@ class RiskScoreCalculator:
         if respiratory_rate is not None:
             if respiratory_rate >= 22:
                 score += 1
-                details['respiratory_rate'] = f"{respiratory_rate} ≥22 (+1)"
+                details['respiratory_rate'] = _LazyDetail("{} ≥22 (+1)", (respiratory_rate,))
             else:
-                details['respiratory_rate'] = f"{respiratory_rate} <22 (0)"
+                details['respiratory_rate'] = _LazyDetail("{} <22 (0)", (respiratory_rate,))
         else:
             missing.append('respiratory_rate')
 
@@ -96,9 +441,9 @@ class RiskScoreCalculator:
         if gcs_score is not None:
             if gcs_score < 15:
                 score += 1
-                details['mentation'] = f"GCS {gcs_score} <15 (+1)"
+                details['mentation'] = _LazyDetail("GCS {} <15 (+1)", (gcs_score,))
             else:
-                details['mentation'] = f"GCS {gcs_score} =15 (0)"
+                details['mentation'] = _LazyDetail("GCS {} =15 (0)", (gcs_score,))
         else:
             missing.append('gcs_score')
 
@@ -106,46 +451,24 @@ class RiskScoreCalculator:
         if systolic_bp is not None:
             if systolic_bp <= 100:
                 score += 1
-                details['systolic_bp'] = f"{systolic_bp} ≤100 (+1)"
+                details['systolic_bp'] = _LazyDetail("{} ≤100 (+1)", (systolic_bp,))
             else:
-                details['systolic_bp'] = f"{systolic_bp} >100 (0)"
+                details['systolic_bp'] = _LazyDetail("{} >100 (0)", (systolic_bp,))
         else:
             missing.append('systolic_bp')
 
         # Determine risk level
-        if score >= 2:
-            risk_level = RiskLevel.HIGH
-            interpretation = "High risk for poor outcomes. Sepsis workup indicated."
-        elif score == 1:
-            risk_level = RiskLevel.MODERATE
-            interpretation = "Moderate risk. Consider sepsis evaluation."
-        else:
-            risk_level = RiskLevel.LOW
-            interpretation = "Low risk for sepsis-related adverse outcomes."
+        risk_level, interpretation = _lookup_band(_QSOFA_BANDS, _qsofa_band, score)
 
         # Generate recommendations
-        recommendations = []
-        if score >= 2:
-            recommendations.extend([
-                "🚨 qSOFA ≥2: High risk for sepsis",
-                "Obtain blood cultures before antibiotics",
-                "Start broad-spectrum antibiotics within 1 hour",
-                "Measure lactate level",
-                "Consider ICU consultation"
-            ])
-        elif score == 1:
-            recommendations.extend([
-                "Monitor closely for sepsis progression",
-                "Reassess qSOFA with each vital signs check",
-                "Consider infection workup"
-            ])
+        recommendations = list(_QSOFA_RECS[min(score, 2)])
 
         if missing:
             recommendations.append(
                 f"ℹ️ Incomplete data ({', '.join(missing)}) - obtain for accurate assessment"
             )
 
-        logger.info(f"qSOFA calculated: {score}/3 ({risk_level.value})")
+        logger.info("qSOFA calculated: %s/3 (%s)", score, risk_level)
 
         return ScoreResult(
             score=score,
@@ -157,6 +480,29 @@ class RiskScoreCalculator:
             score_details=details
         )
 
+    def calculate_qsofa_batch(
+        self,
+        systolic_bp: Sequence[Optional[int]],
+        respiratory_rate: Sequence[Optional[int]],
+        gcs_score: Sequence[Optional[int]]
+    ) -> Tuple[List[int], List[int], List[RiskLevel]]:
+        """
+        qSOFA for a cohort: (scores, missing masks, risk levels), one entry per row.
+        Missing values score 0 and set their QSOFA_MISSING_FIELDS bit.
+        """
+        rows = list(zip(systolic_bp, respiratory_rate, gcs_score, strict=True))
+        scores = [
+            (rr is not None and rr >= 22)
+            + (gcs is not None and gcs < 15)
+            + (sbp is not None and sbp <= 100)
+            for sbp, rr, gcs in rows
+        ]
+        masks = [
+            (rr is None) | (gcs is None) << 1 | (sbp is None) << 2
+            for sbp, rr, gcs in rows
+        ]
+        return scores, masks, [_QSOFA_LEVELS[score] for score in scores]
+
     def calculate_nihss(
         self,
         # Level of consciousness
@@ -175,31 +521,49 @@ class RiskScoreCalculator:
         sensory: Optional[int] = None,         # 0-2
         language: Optional[int] = None,        # 0-3
         dysarthria: Optional[int] = None,      # 0-2
-        extinction: Optional[int] = None       # 0-2
+        extinction: Optional[int] = None,      # 0-2
+        render_details: bool = False
     ) -> ScoreResult:
 
-        components = {
-            'LOC Questions': loc_questions,
-            'LOC Commands': loc_commands,
-            'Gaze': gaze,
-            'Visual Fields': visual_fields,
-            'Facial Palsy': facial_palsy,
-            'Motor Left Arm': motor_left_arm,
-            'Motor Right Arm': motor_right_arm,
-            'Motor Left Leg': motor_left_leg,
-            'Motor Right Leg': motor_right_leg,
-            'Ataxia': ataxia,
-            'Sensory': sensory,
-            'Language': language,
-            'Dysarthria': dysarthria,
-            'Extinction/Inattention': extinction
-        }
+        return _finish(
+            self._nihss_impl(
+                loc_questions, loc_commands, gaze, visual_fields, facial_palsy,
+                motor_left_arm, motor_right_arm, motor_left_leg, motor_right_leg,
+                ataxia, sensory, language, dysarthria, extinction
+            ),
+            render_details
+        )
+
+    @staticmethod
+    @_memoized
+    def _nihss_impl(
+        loc_questions: Optional[int],
+        loc_commands: Optional[int],
+        gaze: Optional[int],
+        visual_fields: Optional[int],
+        facial_palsy: Optional[int],
+        motor_left_arm: Optional[int],
+        motor_right_arm: Optional[int],
+        motor_left_leg: Optional[int],
+        motor_right_leg: Optional[int],
+        ataxia: Optional[int],
+        sensory: Optional[int],
+        language: Optional[int],
+        dysarthria: Optional[int],
+        extinction: Optional[int]
+    ) -> ScoreResult:
+
+        values = (
+            loc_questions, loc_commands, gaze, visual_fields, facial_palsy,
+            motor_left_arm, motor_right_arm, motor_left_leg, motor_right_leg,
+            ataxia, sensory, language, dysarthria, extinction
+        )
 
         score = 0
         missing = []
         details = {}
 
-        for name, value in components.items():
+        for name, value in zip(_NIHSS_ITEMS, values):
             if value is not None:
                 score += value
                 details[name] = value
@@ -207,35 +571,17 @@ class RiskScoreCalculator:
                 missing.append(name)
 
         # Determine risk level and interpretation
-        if score == 0:
-            risk_level = RiskLevel.MINIMAL
-            interpretation = "No stroke symptoms detected"
-        elif score <= 4:
-            risk_level = RiskLevel.LOW
-            interpretation = "Minor stroke"
-        elif score <= 15:
-            risk_level = RiskLevel.MODERATE
-            interpretation = "Moderate stroke"
-        elif score <= 20:
-            risk_level = RiskLevel.HIGH
-            interpretation = "Moderate to severe stroke"
-        else:
-            risk_level = RiskLevel.VERY_HIGH
-            interpretation = "Severe stroke"
+        risk_level, interpretation = _lookup_band(_NIHSS_BANDS, _nihss_band, score)
 
         # Generate recommendations
-        recommendations = []
-        if score > 0:
-            recommendations.append("🚨 Stroke detected - activate stroke protocol")
-            recommendations.append("CT head STAT (rule out hemorrhage)")
-            recommendations.append("Check time of symptom onset (thrombolysis window)")
-
-            if score >= 16:
-                recommendations.append("Consider thrombectomy evaluation")
-                recommendations.append("Neurology/stroke team consultation STAT")
-
-            if score <= 4:
-                recommendations.append("May be candidate for outpatient management if stable")
+        if score <= 0:
+            recommendations = []
+        elif score <= 4:
+            recommendations = list(_NIHSS_MINOR_RECS)
+        elif score >= 16:
+            recommendations = list(_NIHSS_SEVERE_RECS)
+        else:
+            recommendations = list(_NIHSS_STROKE_RECS)
 
         if missing:
             recommendations.append(
@@ -243,7 +589,7 @@ class RiskScoreCalculator:
                 "complete exam for accurate score"
             )
 
-        logger.info(f"NIHSS calculated: {score}/42 ({interpretation})")
+        logger.info("NIHSS calculated: %s/42 (%s)", score, interpretation)
 
         return ScoreResult(
             score=score,
@@ -263,7 +609,28 @@ class RiskScoreCalculator:
         has_hypertension: bool = False,
         has_diabetes: bool = False,
         has_stroke_tia: bool = False,
-        has_vascular_disease: bool = False
+        has_vascular_disease: bool = False,
+        render_details: bool = False
+    ) -> ScoreResult:
+
+        return _finish(
+            self._cha2ds2vasc_impl(
+                age, sex, has_chf, has_hypertension, has_diabetes, has_stroke_tia,
+                has_vascular_disease
+            ),
+            render_details
+        )
+
+    @staticmethod
+    @_memoized
+    def _cha2ds2vasc_impl(
+        age: Optional[int],
+        sex: Optional[str],
+        has_chf: bool,
+        has_hypertension: bool,
+        has_diabetes: bool,
+        has_stroke_tia: bool,
+        has_vascular_disease: bool
     ) -> ScoreResult:
 
         score = 0
@@ -284,12 +651,12 @@ class RiskScoreCalculator:
         if age is not None:
             if age >= 75:
                 score += 2
-                details['Age'] = f"{age} years (+2)"
+                details['Age'] = _LazyDetail("{} years (+2)", (age,))
             elif age >= 65:
                 score += 1
-                details['Age'] = f"{age} years (+1)"
+                details['Age'] = _LazyDetail("{} years (+1)", (age,))
             else:
-                details['Age'] = f"{age} years (0)"
+                details['Age'] = _LazyDetail("{} years (0)", (age,))
         else:
             missing.append('age')
 
@@ -309,8 +676,9 @@ class RiskScoreCalculator:
             details['Vascular Disease'] = "+1"
 
         # Sex
+        is_female = bool(sex) and sex.upper() == 'F'
         if sex:
-            if sex.upper() == 'F':
+            if is_female:
                 score += 1
                 details['Sex'] = "Female (+1)"
             else:
@@ -319,55 +687,25 @@ class RiskScoreCalculator:
             missing.append('sex')
 
         # Determine risk level
-        if score == 0:
-            risk_level = RiskLevel.LOW
-            interpretation = "Low risk (0.2% annual stroke risk)"
-        elif score == 1:
-            risk_level = RiskLevel.LOW
-            interpretation = "Low-moderate risk (0.6% annual stroke risk)"
-        elif score <= 3:
-            risk_level = RiskLevel.MODERATE
-            interpretation = f"Moderate risk ({['2.2%', '2.2%', '3.2%'][score-2]} annual stroke risk)"
-        elif score <= 5:
-            risk_level = RiskLevel.HIGH
-            interpretation = f"High risk ({['4.8%', '7.2%'][score-4]} annual stroke risk)"
-        else:
-            risk_level = RiskLevel.VERY_HIGH
-            interpretation = f"Very high risk (>9% annual stroke risk)"
+        risk_level, interpretation = _lookup_band(_CHA2DS2VASC_BANDS, _cha2ds2vasc_band, score)
 
         # Recommendations
-        recommendations = []
         if score >= 2:
-            recommendations.append(
-                "🩸 Anticoagulation recommended (unless contraindicated)"
-            )
-            recommendations.append(
-                "Options: Warfarin (INR 2-3) or DOAC (apixaban, rivaroxaban, etc.)"
-            )
+            recommendations = list(_CHA2DS2VASC_HIGH_RECS)
         elif score == 1:
-            if sex and sex.upper() == 'F' and score == 1:
-                recommendations.append(
-                    "Consider anticoagulation vs. aspirin (shared decision making)"
-                )
+            if is_female:
+                recommendations = list(_CHA2DS2VASC_SEX_ONLY_RECS)
             else:
-                recommendations.append(
-                    "Anticoagulation recommended for most patients"
-                )
+                recommendations = list(_CHA2DS2VASC_ONE_RECS)
         else:
-            recommendations.append(
-                "Low risk - anticoagulation generally not recommended"
-            )
-
-        recommendations.append(
-            "Reassess score annually and with status changes"
-        )
+            recommendations = list(_CHA2DS2VASC_LOW_RECS)
 
         if missing:
             recommendations.append(
                 f"ℹ️ Missing data: {', '.join(missing)}"
             )
 
-        logger.info(f"CHA₂DS₂-VASc calculated: {score}/9 ({risk_level.value})")
+        logger.info("CHA₂DS₂-VASc calculated: %s/9 (%s)", score, risk_level)
 
         return ScoreResult(
             score=score,
@@ -379,6 +717,33 @@ class RiskScoreCalculator:
             score_details=details
         )
 
+    def calculate_cha2ds2vasc_batch(
+        self,
+        age: Sequence[Optional[int]],
+        sex: Sequence[Optional[str]],
+        has_chf: Sequence[bool],
+        has_hypertension: Sequence[bool],
+        has_diabetes: Sequence[bool],
+        has_stroke_tia: Sequence[bool],
+        has_vascular_disease: Sequence[bool]
+    ) -> Tuple[List[int], List[int], List[RiskLevel]]:
+        """
+        CHA₂DS₂-VASc for a cohort: (scores, missing masks, risk levels), one
+        entry per row. Missing values score 0 and set their
+        CHA2DS2VASC_MISSING_FIELDS bit.
+        """
+        scores = [
+            bool(chf) + bool(htn) + bool(dm) + 2 * bool(stroke) + bool(vasc)
+            + (0 if a is None else 2 if a >= 75 else 1 if a >= 65 else 0)
+            + (bool(sx) and sx.upper() == 'F')
+            for a, sx, chf, htn, dm, stroke, vasc in zip(
+                age, sex, has_chf, has_hypertension, has_diabetes,
+                has_stroke_tia, has_vascular_disease, strict=True
+            )
+        ]
+        masks = [(a is None) | (not sx) << 1 for a, sx in zip(age, sex)]
+        return scores, masks, [_CHA2DS2VASC_LEVELS[score] for score in scores]
+
     def calculate_curb65(
         self,
         confusion: bool = False,
@@ -386,111 +751,81 @@ class RiskScoreCalculator:
         respiratory_rate: Optional[int] = None,
         systolic_bp: Optional[int] = None,
         diastolic_bp: Optional[int] = None,
-        age: Optional[int] = None
+        age: Optional[int] = None,
+        render_details: bool = False
     ) -> ScoreResult:
 
-        score = 0
-        missing = []
-        details = {}
-
-        # Confusion
-        if confusion:
-            score += 1
-            details['Confusion'] = "Present (+1)"
-        else:
-            details['Confusion'] = "Absent (0)"
-
-        # Urea
-        if urea_mmol_l is not None:
-            if urea_mmol_l > 7:
-                score += 1
-                details['Urea'] = f"{urea_mmol_l} mmol/L >7 (+1)"
-            else:
-                details['Urea'] = f"{urea_mmol_l} mmol/L ≤7 (0)"
-        else:
-            missing.append('urea')
-
-        # Respiratory rate
-        if respiratory_rate is not None:
-            if respiratory_rate >= 30:
-                score += 1
-                details['Respiratory Rate'] = f"{respiratory_rate} ≥30 (+1)"
-            else:
-                details['Respiratory Rate'] = f"{respiratory_rate} <30 (0)"
-        else:
-            missing.append('respiratory_rate')
-
-        # Blood pressure
-        if systolic_bp is not None and diastolic_bp is not None:
-            if systolic_bp < 90 or diastolic_bp <= 60:
-                score += 1
-                details['Blood Pressure'] = f"{systolic_bp}/{diastolic_bp} (+1)"
-            else:
-                details['Blood Pressure'] = f"{systolic_bp}/{diastolic_bp} (0)"
-        else:
-            missing.append('blood_pressure')
-
-        # Age
-        if age is not None:
-            if age >= 65:
-                score += 1
-                details['Age'] = f"{age} years ≥65 (+1)"
-            else:
-                details['Age'] = f"{age} years <65 (0)"
-        else:
-            missing.append('age')
+        return _finish(
+            self._curb65_impl(
+                confusion, urea_mmol_l, respiratory_rate, systolic_bp,
+                diastolic_bp, age
+            ),
+            render_details
+        )
 
-        # Determine risk level
-        if score <= 1:
-            risk_level = RiskLevel.LOW
-            interpretation = "Low severity - suitable for outpatient treatment"
-        elif score == 2:
-            risk_level = RiskLevel.MODERATE
-            interpretation = "Moderate severity - consider hospitalization"
-        else:
-            risk_level = RiskLevel.HIGH
-            interpretation = f"High severity (score {score}) - hospitalize, consider ICU"
+    @staticmethod
+    @_memoized
+    def _curb65_impl(
+        confusion: bool,
+        urea_mmol_l: Optional[float],
+        respiratory_rate: Optional[int],
+        systolic_bp: Optional[int],
+        diastolic_bp: Optional[int],
+        age: Optional[int]
+    ) -> ScoreResult:
 
-        # Recommendations
-        recommendations = []
-        if score <= 1:
-            recommendations.append(
-                "✓ Low risk - outpatient treatment appropriate"
-            )
-            recommendations.append(
-                "Oral antibiotics (e.g., amoxicillin, doxycycline, or macrolide)"
-            )
-            recommendations.append(
-                "Close follow-up in 48-72 hours"
+        # Presence of each measurement, then each criterion as a bool
+        has_urea = urea_mmol_l is not None
+        has_rr = respiratory_rate is not None
+        has_bp = systolic_bp is not None and diastolic_bp is not None
+        has_age = age is not None
+
+        c_confusion = bool(confusion)
+        c_urea = has_urea and urea_mmol_l > 7
+        c_rr = has_rr and respiratory_rate >= 30
+        c_bp = has_bp and (systolic_bp < 90 or diastolic_bp <= 60)
+        c_age = has_age and age >= 65
+
+        score = c_confusion + c_urea + c_rr + c_bp + c_age
+        missing = [
+            name for name, present in (
+                ('urea', has_urea),
+                ('respiratory_rate', has_rr),
+                ('blood_pressure', has_bp),
+                ('age', has_age),
+            ) if not present
+        ]
+
+        details = {'Confusion': "Present (+1)" if c_confusion else "Absent (0)"}
+        if has_urea:
+            details['Urea'] = _LazyDetail(
+                "{} mmol/L >7 (+1)" if c_urea else "{} mmol/L ≤7 (0)", (urea_mmol_l,)
             )
-        elif score == 2:
-            recommendations.append(
-                "⚠️ Moderate risk - hospitalization vs. close outpatient monitoring"
-            )
-            recommendations.append(
-                "Consider additional risk factors and social circumstances"
-            )
-        else:
-            recommendations.append(
-                "🚨 High risk - hospitalize immediately"
+        if has_rr:
+            details['Respiratory Rate'] = _LazyDetail(
+                "{} ≥30 (+1)" if c_rr else "{} <30 (0)", (respiratory_rate,)
             )
-            recommendations.append(
-                "IV antibiotics (e.g., ceftriaxone + azithromycin)"
+        if has_bp:
+            details['Blood Pressure'] = _LazyDetail(
+                "{}/{} (+1)" if c_bp else "{}/{} (0)", (systolic_bp, diastolic_bp)
             )
-            recommendations.append(
-                "Chest X-ray, blood cultures, CBC, BMP"
+        if has_age:
+            details['Age'] = _LazyDetail(
+                "{} years ≥65 (+1)" if c_age else "{} years <65 (0)", (age,)
             )
-            if score >= 4:
-                recommendations.append(
-                    "Consider ICU admission"
-                )
+
+        # Determine risk level
+        risk_level, interpretation = _lookup_band(_CURB65_BANDS, _curb65_band, score)
+
+        # Recommendations
+        recommendations = list(_CURB65_RECS[min(score, 5)])
 
         if missing:
             recommendations.append(
                 f"ℹ️ Missing: {', '.join(missing)} - obtain for complete score"
             )
 
-        logger.info(f"CURB-65 calculated: {score}/5 ({risk_level.value})")
+        logger.info("CURB-65 calculated: %s/5 (%s)", score, risk_level)
 
         return ScoreResult(
             score=score,
@@ -502,15 +837,60 @@ class RiskScoreCalculator:
             score_details=details
         )
 
+    def calculate_curb65_batch(
+        self,
+        confusion: Sequence[bool],
+        urea_mmol_l: Sequence[Optional[float]],
+        respiratory_rate: Sequence[Optional[int]],
+        systolic_bp: Sequence[Optional[int]],
+        diastolic_bp: Sequence[Optional[int]],
+        age: Sequence[Optional[int]]
+    ) -> Tuple[List[int], List[int], List[RiskLevel]]:
+        """
+        CURB-65 for a cohort: (scores, missing masks, risk levels), one entry
+        per row. Missing values score 0 and set their CURB65_MISSING_FIELDS bit.
+        """
+        rows = list(zip(
+            confusion, urea_mmol_l, respiratory_rate,
+            systolic_bp, diastolic_bp, age, strict=True
+        ))
+        scores = [
+            bool(conf)
+            + (urea is not None and urea > 7)
+            + (rr is not None and rr >= 30)
+            + (sbp is not None and dbp is not None and (sbp < 90 or dbp <= 60))
+            + (a is not None and a >= 65)
+            for conf, urea, rr, sbp, dbp, a in rows
+        ]
+        masks = [
+            (urea is None) | (rr is None) << 1
+            | (sbp is None or dbp is None) << 2 | (a is None) << 3
+            for _, urea, rr, sbp, dbp, a in rows
+        ]
+        return scores, masks, [_CURB65_LEVELS[score] for score in scores]
+
     def calculate_meld(
         self,
         creatinine_mg_dl: Optional[float] = None,
         bilirubin_mg_dl: Optional[float] = None,
         inr: Optional[float] = None,
-        dialysis_twice: bool = False
+        dialysis_twice: bool = False,
+        render_details: bool = False
     ) -> ScoreResult:
 
-        import math
+        return _finish(
+            self._meld_impl(creatinine_mg_dl, bilirubin_mg_dl, inr, dialysis_twice),
+            render_details
+        )
+
+    @staticmethod
+    @_memoized
+    def _meld_impl(
+        creatinine_mg_dl: Optional[float],
+        bilirubin_mg_dl: Optional[float],
+        inr: Optional[float],
+        dialysis_twice: bool
+    ) -> ScoreResult:
 
         missing = []
 
@@ -533,87 +913,39 @@ class RiskScoreCalculator:
                 missing_data=missing
             )
 
-        # Apply floor values
-        creat = max(1.0, creatinine_mg_dl)
-        bili = max(1.0, bilirubin_mg_dl)
-        inr_val = max(1.0, inr)
-
-        # If on dialysis twice in past week, use creatinine = 4.0
-        if dialysis_twice:
-            creat = 4.0
-
         # Calculate MELD score
         try:
-            raw_score = (
-                10 * (
-                    0.957 * math.log(creat) +
-                    0.378 * math.log(bili) +
-                    1.120 * math.log(inr_val) +
-                    0.643
-                )
-            )
-
-            # Round and cap
-            score = max(6, min(40, round(raw_score)))
-
+            score = _meld_score(creatinine_mg_dl, bilirubin_mg_dl, inr, dialysis_twice)
         except (ValueError, OverflowError) as e:
-            logger.error(f"MELD calculation error: {e}")
+            logger.error("MELD calculation error: %s", e)
             return ScoreResult(
                 score=0,
                 max_score=40,
                 risk_level=RiskLevel.LOW,
                 interpretation="Calculation error - check lab values",
                 recommendations=["⚠️ Invalid lab values for MELD calculation"],
-                missing_data=[]
+                missing_data=missing
             )
 
         # Determine risk level
-        if score < 10:
-            risk_level = RiskLevel.LOW
-            interpretation = f"MELD {score}: 1.9% 90-day mortality"
-        elif score < 20:
-            risk_level = RiskLevel.MODERATE
-            interpretation = f"MELD {score}: ~6% 90-day mortality"
-        elif score < 30:
-            risk_level = RiskLevel.HIGH
-            interpretation = f"MELD {score}: ~20% 90-day mortality"
-        elif score < 40:
-            risk_level = RiskLevel.VERY_HIGH
-            interpretation = f"MELD {score}: ~53% 90-day mortality"
-        else:
-            risk_level = RiskLevel.CRITICAL
-            interpretation = f"MELD {score}: >70% 90-day mortality"
+        risk_level, interpretation = _lookup_band(_MELD_BANDS, _meld_band, score)
 
         # Recommendations
-        recommendations = []
-        if score >= 15:
-            recommendations.append(
-                "⚠️ High MELD score - transplant evaluation indicated"
-            )
-            recommendations.append(
-                "Hepatology/transplant surgery consultation"
-            )
-
         if score >= 30:
-            recommendations.append(
-                "🚨 Critical MELD score - urgent transplant consideration"
-            )
-            recommendations.append(
-                "ICU-level monitoring may be required"
-            )
-
-        recommendations.append(
-            "Recalculate MELD regularly (weekly-monthly depending on score)"
-        )
+            recommendations = list(_MELD_CRITICAL_RECS)
+        elif score >= 15:
+            recommendations = list(_MELD_HIGH_RECS)
+        else:
+            recommendations = list(_MELD_LOW_RECS)
 
         details = {
-            'Creatinine': f"{creatinine_mg_dl} mg/dL",
-            'Bilirubin': f"{bilirubin_mg_dl} mg/dL",
-            'INR': f"{inr}",
+            'Creatinine': _LazyDetail("{} mg/dL", (creatinine_mg_dl,)),
+            'Bilirubin': _LazyDetail("{} mg/dL", (bilirubin_mg_dl,)),
+            'INR': _LazyDetail("{}", (inr,)),
             'Dialysis': "Yes (creatinine set to 4.0)" if dialysis_twice else "No"
         }
 
-        logger.info(f"MELD calculated: {score} ({risk_level.value})")
+        logger.info("MELD calculated: %s (%s)", score, risk_level)
 
         return ScoreResult(
             score=score,
@@ -621,15 +953,61 @@ class RiskScoreCalculator:
             risk_level=risk_level,
             interpretation=interpretation,
             recommendations=recommendations,
-            missing_data=[],
+            missing_data=missing,  # checked empty above; reuse rather than allocate
             score_details=details
         )
 
+    def calculate_meld_batch(
+        self,
+        creatinine_mg_dl: Sequence[Optional[float]],
+        bilirubin_mg_dl: Sequence[Optional[float]],
+        inr: Sequence[Optional[float]],
+        dialysis_twice: Sequence[bool]
+    ) -> Tuple[List[Optional[int]], List[int], List[Optional[RiskLevel]]]:
+        """
+        MELD for a cohort: (scores, missing masks, risk levels), one entry per
+        row. Score and risk level are None where a lab value is missing or
+        invalid; missing labs set their MELD_MISSING_FIELDS bit.
+        """
+        scores = []
+        masks = []
+        levels = []
+        for creat, bili, inr_val, dialysis in zip(
+            creatinine_mg_dl, bilirubin_mg_dl, inr, dialysis_twice, strict=True
+        ):
+            mask = (creat is None) | (bili is None) << 1 | (inr_val is None) << 2
+            masks.append(mask)
+            score = None
+            if not mask:
+                try:
+                    score = _meld_score(creat, bili, inr_val, dialysis)
+                except (ValueError, OverflowError):
+                    pass
+            scores.append(score)
+            levels.append(
+                None if score is None else _lookup_band(_MELD_BANDS, _meld_band, score)[0]
+            )
+        return scores, masks, levels
+
     def calculate_gcs(
         self,
         eye_opening: Optional[int] = None,     # 1-4
         verbal_response: Optional[int] = None,  # 1-5
-        motor_response: Optional[int] = None    # 1-6
+        motor_response: Optional[int] = None,    # 1-6
+        render_details: bool = False
+    ) -> ScoreResult:
+
+        return _finish(
+            self._gcs_impl(eye_opening, verbal_response, motor_response),
+            render_details
+        )
+
+    @staticmethod
+    @_memoized
+    def _gcs_impl(
+        eye_opening: Optional[int],
+        verbal_response: Optional[int],
+        motor_response: Optional[int]
     ) -> ScoreResult:
 
         missing = []
@@ -661,46 +1039,23 @@ class RiskScoreCalculator:
             )
 
         # Determine risk level
-        if score >= 13:
-            risk_level = RiskLevel.LOW
-            interpretation = f"GCS {score}: Mild impairment"
-        elif score >= 9:
-            risk_level = RiskLevel.MODERATE
-            interpretation = f"GCS {score}: Moderate impairment"
-        else:
-            risk_level = RiskLevel.CRITICAL
-            interpretation = f"GCS {score}: Severe impairment"
+        risk_level, interpretation = _lookup_band(_GCS_BANDS, _gcs_band, score)
 
         # Recommendations
-        recommendations = []
         if score <= 8:
-            recommendations.append(
-                "🚨 GCS ≤8: Consider airway protection (intubation)"
-            )
-            recommendations.append(
-                "CT head STAT"
-            )
-            recommendations.append(
-                "Neurosurgery/neurology consultation"
-            )
-            recommendations.append(
-                "ICU admission"
-            )
+            recommendations = list(_GCS_SEVERE_RECS)
         elif score <= 12:
-            recommendations.append(
-                "⚠️ Moderate impairment - close monitoring required"
-            )
-            recommendations.append(
-                "Frequent neuro checks (q1-2h)"
-            )
+            recommendations = list(_GCS_MODERATE_RECS)
+        else:
+            recommendations = []
 
         details = {
-            'Eye Opening': f"{eye_opening}/4",
-            'Verbal Response': f"{verbal_response}/5",
-            'Motor Response': f"{motor_response}/6"
+            'Eye Opening': _LazyDetail("{}/4", (eye_opening,)),
+            'Verbal Response': _LazyDetail("{}/5", (verbal_response,)),
+            'Motor Response': _LazyDetail("{}/6", (motor_response,))
         }
 
-        logger.info(f"GCS calculated: {score}/15 ({interpretation})")
+        logger.info("GCS calculated: %s/15 (%s)", score, interpretation)
 
         return ScoreResult(
             score=score,
@@ -708,7 +1063,7 @@ class RiskScoreCalculator:
             risk_level=risk_level,
             interpretation=interpretation,
             recommendations=recommendations,
-            missing_data=[],
+            missing_data=missing,  # checked empty above; reuse rather than allocate
             score_details=details
         )
 
@@ -718,4 +1073,9 @@ __all__ = [
     'RiskScoreCalculator',
     'ScoreResult',
     'RiskLevel',
+    'QSOFA_MISSING_FIELDS',
+    'CHA2DS2VASC_MISSING_FIELDS',
+    'CURB65_MISSING_FIELDS',
+    'MELD_MISSING_FIELDS',
+    'missing_fields',
 ]
@@ -0,0 +1,63 @@
+"""Regression tests for helpers.sanitize_input"""
+import re
+
+import pytest
+
+import helpers
+
+
+def _engines():
+    engines = [pytest.param(re, id="re")]
+    try:
+        import re2
+    except ImportError:
+        engines.append(pytest.param(None, id="re2", marks=pytest.mark.skip(
+            reason="google-re2 not installed")))
+    else:
+        engines.append(pytest.param(re2, id="re2"))
+    return engines
+
+
+@pytest.fixture(params=_engines())
+def engine(request, monkeypatch):
+    # sanitize_input uses whichever engine was importable; run it under both
+    monkeypatch.setattr(helpers, "_DANGEROUS_RE",
+                        helpers._compile_dangerous(request.param))
+    return request.param
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("javaſcript:alert(1)", "alert(1)"),      # U+017F LATIN SMALL LETTER LONG S
+    ("javascrıpt:alert(1)", "alert(1)"),      # U+0131 LATIN SMALL LETTER DOTLESS I
+    ("javascrİpt:alert(1)", "alert(1)"),      # U+0130 LATIN CAPITAL LETTER I WITH DOT
+    ("JAVAſCRİPT:alert(1)", "alert(1)"),
+    ("<ſcrıpt>alert(1)</ſcrİpt>ok", "ok"),
+    ("<İframe src=x>", "src=x>"),
+    ("<b onİnput=x>", "<b x>"),
+])
+def test_case_folded_variants_are_stripped(engine, text, expected):
+    assert helpers.sanitize_input(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("javascript:alert(1)", "alert(1)"),
+    ("<script>alert(1)</script>chest pain", "chest pain"),
+    ('<img src=x onerror="alert(1)">', '<img src=x "alert(1)">'),
+    ("jajavascript:vascript:alert(1)", "alert(1)"),
+])
+def test_dangerous_patterns_are_stripped(engine, text, expected):
+    assert helpers.sanitize_input(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("  chest   pain\x00 and fever ", "chest pain and fever"),
+    ("fièvre et toux", "fièvre et toux"),
+    ("ratio 2:1", "ratio 2:1"),
+    ("", ""),
+])
+def test_benign_input_is_unchanged(engine, text, expected):
+    assert helpers.sanitize_input(text) == expected
+
+
+def test_max_length(engine):
+    assert helpers.sanitize_input("a" * 10, max_length=4) == "aaaa"
@@ -20,34 +20,45 @@ All code included in this repository was either written by me or reviewed,
 adapted, and implemented by me as part of the final system.
 
 """
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, field, asdict
+from bisect import bisect_left
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Any
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
+from types import MappingProxyType
 import logging
+import operator
 
 logger = logging.getLogger(__name__)
 
 
-class VitalSignStatus(Enum):
-    """Vital sign status levels"""
-    NORMAL = "normal"
-    BORDERLINE = "borderline"
-    ABNORMAL = "abnormal"
-    CRITICAL = "critical"
+class VitalSignStatus(IntEnum):
+    """Vital sign status levels, ordered by severity (serialized by lowercase name)"""
+    NORMAL = 0
+    BORDERLINE = 1
+    ABNORMAL = 2
+    CRITICAL = 3
 
 
-class AlertLevel(Enum):
-    """Alert severity levels"""
-    INFO = "info"
-    WARNING = "warning"
-    URGENT = "urgent"
-    CRITICAL = "critical"
-    EMERGENCY = "emergency"
+class AlertLevel(IntEnum):
+    """Alert severity levels, ordered by severity (serialized by lowercase name)"""
+    INFO = 0
+    WARNING = 1
+    URGENT = 2
+    CRITICAL = 3
+    EMERGENCY = 4
+
+
+# JSON names for the enums, indexed by value (avoids the Enum.name property per dict)
+_STATUS_NAMES = tuple(status.name.lower() for status in VitalSignStatus)
+_ALERT_LEVEL_NAMES = tuple(level.name.lower() for level in AlertLevel)
+
+# Overall analysis severity, indexed by the worst VitalSignStatus
+_SEVERITY_BY_RANK = _STATUS_NAMES
 
 
 # Age-adjusted vital sign ranges
-VITAL_RANGES = {
+_VITAL_RANGES = {
     'temperature_c': {
         'adult': {'low_critical': 35.0, 'low': 36.1, 'high': 37.8, 'high_critical': 40.0},
         'child': {'low_critical': 35.5, 'low': 36.5, 'high': 37.5, 'high_critical': 39.5},
@@ -83,9 +94,92 @@ VITAL_RANGES = {
     },
 }
 
-
-
-@dataclass
+# Read-only view (every level) so the derived lookup tables below can't drift
+VITAL_RANGES = MappingProxyType({
+    vital_name: MappingProxyType({
+        age_group: MappingProxyType(bounds) for age_group, bounds in ranges.items()
+    })
+    for vital_name, ranges in _VITAL_RANGES.items()
+})
+
+_AGE_GROUPS = ('adult', 'elderly', 'child', 'infant', 'all')
+
+
+# (low_critical, low, high, high_critical, low_margin, high_margin)
+_RangeRow = Tuple[Optional[float], float, float, Optional[float], float, float]
+
+
+def _build_range_table() -> Dict[str, Dict[str, _RangeRow]]:
+    """Flatten VITAL_RANGES to age_group -> vital -> bounds plus precomputed 10% margins"""
+    table = {age_group: {} for age_group in _AGE_GROUPS}
+    for vital_name, ranges in VITAL_RANGES.items():
+        for age_group in _AGE_GROUPS:
+            # Resolve the age-specific range with its 'all' fallback once, here
+            range_data = ranges.get(age_group) or ranges.get('all')
+            if range_data:
+                low = range_data.get('low', float('-inf'))
+                high = range_data.get('high', float('inf'))
+                table[age_group][vital_name] = (
+                    range_data.get('low_critical'),
+                    low,
+                    high,
+                    range_data.get('high_critical'),
+                    # Borderline band: within 10% of the abnormal thresholds
+                    low * 1.1 if low > 0 else low + abs(low * 0.1),
+                    high * 0.9 if high > 0 else high - abs(high * 0.1),
+                )
+    return table
+
+
+# Range rows per age group, so an analysis resolves its age group's row set once
+_RANGES_BY_AGE = _build_range_table()
+
+
+
+# NEWS step functions: a value scores _POINTS[i] where i is the first edge it
+# does not exceed (bisect_left matches the original "<=" ladders exactly)
+_NEWS_RR_EDGES = (8, 11, 20, 24)
+_NEWS_RR_POINTS = (3, 1, 0, 2, 3)
+_NEWS_SPO2_EDGES = (91, 93, 95)
+_NEWS_SPO2_POINTS = (3, 2, 1, 0)
+_NEWS_SBP_EDGES = (90, 100, 110, 219)
+_NEWS_SBP_POINTS = (3, 2, 1, 0, 3)
+_NEWS_HR_EDGES = (40, 50, 90, 110, 130)
+_NEWS_HR_POINTS = (3, 1, 0, 1, 2, 3)
+_NEWS_TEMP_EDGES = (35.0, 36.0, 38.0, 39.0)
+_NEWS_TEMP_POINTS = (3, 1, 0, 1, 2)
+
+
+def _news_score(
+    rr: Optional[float],
+    spo2: Optional[float],
+    sbp: Optional[float],
+    hr: Optional[float],
+    temp: Optional[float],
+    gcs: Optional[float]
+) -> int:
+    """NEWS kernel over raw vitals; missing (None/0) values score nothing"""
+    score = 0
+
+    if rr:
+        score += _NEWS_RR_POINTS[bisect_left(_NEWS_RR_EDGES, rr)]
+    if spo2:
+        score += _NEWS_SPO2_POINTS[bisect_left(_NEWS_SPO2_EDGES, spo2)]
+    if sbp:
+        score += _NEWS_SBP_POINTS[bisect_left(_NEWS_SBP_EDGES, sbp)]
+    if hr:
+        score += _NEWS_HR_POINTS[bisect_left(_NEWS_HR_EDGES, hr)]
+    if temp:
+        score += _NEWS_TEMP_POINTS[bisect_left(_NEWS_TEMP_EDGES, temp)]
+
+    # Level of consciousness (0 or 3 points)
+    if gcs and gcs < 15:
+        score += 3
+
+    return score
+
+
+@dataclass(slots=True)
 class VitalSigns:
     # Core vital signs
     temperature_c: Optional[float] = None
@@ -111,7 +205,12 @@ class VitalSigns:
     location: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        # Flat scalar fields: no need for asdict()'s recursive deep copy
+        return {
+            name: value
+            for name in _VITAL_SIGNS_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
 
     def is_complete(self) -> bool:
         core_vitals = [
@@ -124,33 +223,307 @@ class VitalSigns:
         return all(v is not None for v in core_vitals)
 
 
-@dataclass
+_VITAL_SIGNS_FIELDS = tuple(f.name for f in fields(VitalSigns))
+
+
+@dataclass(slots=True)
 class RedFlag:
     level: AlertLevel
     title: str
     message: str
     condition: str
-    vital_signs_involved: List[str] = field(default_factory=list)
-    recommended_actions: List[str] = field(default_factory=list)
+    vital_signs_involved: Sequence[str] = field(default_factory=list)
+    recommended_actions: Sequence[str] = field(default_factory=list)
     time_critical: bool = False
     escalation_required: bool = False
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            'level': self.level.value,
+            'level': _ALERT_LEVEL_NAMES[self.level],
             'title': self.title,
             'message': self.message,
             'condition': self.condition,
-            'vital_signs_involved': self.vital_signs_involved,
-            'recommended_actions': self.recommended_actions,
+            'vital_signs_involved': list(self.vital_signs_involved),
+            'recommended_actions': list(self.recommended_actions),
             'time_critical': self.time_critical,
             'escalation_required': self.escalation_required,
             'timestamp': self.timestamp
         }
 
 
-@dataclass
+# Per-condition red flag templates; only the message is patient-specific and is
+# formatted from message_fmt when the flag actually fires
+_ALERT_TEMPLATES = {
+    'hyperthermia': MappingProxyType({
+        'level': AlertLevel.EMERGENCY,
+        'title': "CRITICAL HYPERTHERMIA",
+        'condition': "Hyperthermia",
+        'message_fmt': "Temperature {v}°C - Immediate cooling measures required",
+        'recommended_actions': (
+            "Immediate cooling measures (ice packs, cooling blanket)",
+            "Check for heat stroke, infection, drug reaction",
+            "Monitor for seizures",
+            "Consider ICU transfer"
+        ),
+        'time_critical': True,
+        'escalation_required': True,
+    }),
+    'hypothermia': MappingProxyType({
+        'level': AlertLevel.EMERGENCY,
+        'title': "CRITICAL HYPOTHERMIA",
+        'condition': "Hypothermia",
+        'message_fmt': "Temperature {v}°C - Warming required",
+        'recommended_actions': (
+            "Active warming measures",
+            "Warmed IV fluids",
+            "Cardiac monitoring (risk of arrhythmia)",
+            "Consider ICU"
+        ),
+        'time_critical': True,
+        'escalation_required': True,
+    }),
+    'bradycardia': MappingProxyType({
+        'level': AlertLevel.EMERGENCY,
+        'title': "SEVERE BRADYCARDIA",
+        'condition': "Bradycardia",
+        'message_fmt': "Heart rate {v} bpm - Risk of cardiac arrest",
+        'recommended_actions': (
+            "Continuous cardiac monitoring",
+            "12-lead ECG immediately",
+            "Check medications (beta-blockers, etc.)",
+            "Prepare atropine/pacing",
+            "ACLS team notification"
+        ),
+        'time_critical': True,
+        'escalation_required': True,
+    }),
+    'tachycardia': MappingProxyType({
+        'level': AlertLevel.CRITICAL,
+        'title': "SEVERE TACHYCARDIA",
+        'condition': "Tachycardia",
+        'message_fmt': "Heart rate {v} bpm - Assess for shock/arrhythmia",
+        'recommended_actions': (
+            "12-lead ECG",
+            "Assess for shock (septic, hypovolemic, cardiogenic)",
+            "Check for arrhythmia (SVT, AF, VT)",
+            "Fluid status assessment",
+            "Consider cardiology consult"
+        ),
+        'time_critical': True,
+        'escalation_required': True,
+    }),
+    'hypotension': MappingProxyType({
+        'level': AlertLevel.EMERGENCY,
+        'title': "SEVERE HYPOTENSION / SHOCK",
+        'condition': "Hypotensive Shock",
+        'message_fmt': "BP {v}/{dbp} - SHOCK PROTOCOL",
+        'recommended_actions': (
+            "Initiate shock protocol immediately",
+            "Fluid resuscitation (consider pressors)",
+            "Identify shock type (septic/cardiogenic/hypovolemic)",
+            "Blood cultures before antibiotics",
+            "ICU notification",
+            "Activate rapid response team"
+        ),
+        'time_critical': True,
+        'escalation_required': True,
+    }),
+    'hypertensive_emergency': MappingProxyType({
+        'level': AlertLevel.EMERGENCY,
+        'title': "HYPERTENSIVE EMERGENCY",
+        'condition': "Hypertensive Emergency",
+        'message_fmt': "BP {v}/{dbp} - Risk of end-organ damage",
+        'recommended_actions': (
+            "Assess for end-organ damage (stroke, MI, renal failure)",
+            "Continuous BP monitoring",
+            "IV antihypertensives (nicardipine, labetalol)",
+            "Neuro exam, cardiac markers, renal function",
+            "ICU admission likely required"
+        ),
+        'time_critical': True,
+        'escalation_required': True,
+    }),
+    'hypoxemia': MappingProxyType({
+        'level': AlertLevel.EMERGENCY,
+        'title': "CRITICAL HYPOXEMIA",
+        'condition': "Severe Hypoxemia",
+        'message_fmt': "SpO2 {v}% - Immediate oxygen/airway management",
+        'recommended_actions': (
+            "High-flow oxygen immediately (non-rebreather mask)",
+            "Assess airway patency",
+            "Consider intubation if worsening",
+            "Chest X-ray STAT",
+            "ABG analysis",
+            "Respiratory therapy consult"
+        ),
+        'time_critical': True,
+        'escalation_required': True,
+    }),
+    'bradypnea': MappingProxyType({
+        'level': AlertLevel.EMERGENCY,
+        'title': "SEVERE BRADYPNEA",
+        'condition': "Bradypnea",
+        'message_fmt': "Respiratory rate {v} - Risk of respiratory arrest",
+        'recommended_actions': (
+            "Assess airway immediately",
+            "Check for narcotic overdose (naloxone if suspected)",
+            "Prepare for airway management",
+            "Consider ICU/intubation",
+            "Continuous monitoring"
+        ),
+        'time_critical': True,
+        'escalation_required': True,
+    }),
+    'tachypnea': MappingProxyType({
+        'level': AlertLevel.CRITICAL,
+        'title': "SEVERE TACHYPNEA",
+        'condition': "Tachypnea",
+        'message_fmt': "Respiratory rate {v} - Respiratory distress",
+        'recommended_actions': (
+            "Assess work of breathing",
+            "Oxygen supplementation",
+            "Check for pneumonia, PE, pulmonary edema",
+            "Consider CPAP/BiPAP",
+            "Respiratory therapy consult"
+        ),
+        'time_critical': True,
+        'escalation_required': False,
+    }),
+    'altered_mental_status': MappingProxyType({
+        'level': AlertLevel.EMERGENCY,
+        'title': "SEVERELY ALTERED MENTAL STATUS",
+        'condition': "Altered Mental Status",
+        'message_fmt': "GCS {v} - Consider airway protection",
+        'recommended_actions': (
+            "Protect airway (GCS ≤8 = intubation threshold)",
+            "CT head STAT",
+            "Check glucose immediately",
+            "Toxicology screen",
+            "Neurology consult",
+            "ICU admission"
+        ),
+        'time_critical': True,
+        'escalation_required': True,
+    }),
+    'hyperglycemia': MappingProxyType({
+        'level': AlertLevel.CRITICAL,
+        'title': "SEVERE HYPERGLYCEMIA",
+        'condition': "Hyperglycemia",
+        'message_fmt': "Blood glucose {v} mg/dL - Risk of DKA/HHS",
+        'recommended_actions': (
+            "Check for DKA (BMP, VBG, ketones, anion gap)",
+            "Start insulin drip if DKA confirmed",
+            "Aggressive IV fluid resuscitation",
+            "Potassium monitoring",
+            "Endocrinology consult"
+        ),
+        'time_critical': True,
+        'escalation_required': False,
+    }),
+    'hypoglycemia': MappingProxyType({
+        'level': AlertLevel.EMERGENCY,
+        'title': "SEVERE HYPOGLYCEMIA",
+        'condition': "Hypoglycemia",
+        'message_fmt': "Blood glucose {v} mg/dL - Immediate treatment required",
+        'recommended_actions': (
+            "D50 IV push immediately (if conscious: PO glucose)",
+            "Continuous glucose monitoring",
+            "Check insulin/sulfonylurea levels",
+            "Assess for altered mental status",
+            "Prevent recurrence"
+        ),
+        'time_critical': True,
+        'escalation_required': True,
+    }),
+}
+
+_TEMP_VS = ('temperature',)
+_HR_VS = ('heart_rate',)
+_BP_VS = ('blood_pressure',)
+_SPO2_VS = ('spo2',)
+_RR_VS = ('respiratory_rate',)
+_GCS_VS = ('gcs',)
+_GLUCOSE_VS = ('blood_glucose',)
+
+
+# Red flag rules grouped per vital: (attribute, vitals involved, rules), where
+# each rule is (comparison, threshold, template, secondary (attribute,
+# comparison, threshold) or None, counts as critical alert).
+# Rules within a group are mutually exclusive, so at most one fires per vital.
+# Order matches the clinical order alerts are reported in.
+_RED_FLAG_RULES = (
+    ('temperature_c', _TEMP_VS, (
+        (operator.ge, 40.0, _ALERT_TEMPLATES['hyperthermia'], None, True),
+        (operator.le, 35.0, _ALERT_TEMPLATES['hypothermia'], None, True),
+    )),
+    ('heart_rate_bpm', _HR_VS, (
+        (operator.le, 40, _ALERT_TEMPLATES['bradycardia'], None, True),
+        (operator.ge, 140, _ALERT_TEMPLATES['tachycardia'], None, True),
+    )),
+    ('systolic_bp_mmhg', _BP_VS, (
+        (operator.le, 70, _ALERT_TEMPLATES['hypotension'], None, True),
+        (operator.ge, 180, _ALERT_TEMPLATES['hypertensive_emergency'],
+         ('diastolic_bp_mmhg', operator.ge, 120), True),
+    )),
+    ('spo2_percent', _SPO2_VS, (
+        (operator.le, 85, _ALERT_TEMPLATES['hypoxemia'], None, True),
+    )),
+    ('respiratory_rate_bpm', _RR_VS, (
+        (operator.le, 8, _ALERT_TEMPLATES['bradypnea'], None, True),
+        (operator.ge, 30, _ALERT_TEMPLATES['tachypnea'], None, False),
+    )),
+    ('gcs_score', _GCS_VS, (
+        (operator.le, 8, _ALERT_TEMPLATES['altered_mental_status'], None, True),
+    )),
+    ('blood_glucose_mgdl', _GLUCOSE_VS, (
+        (operator.ge, 400, _ALERT_TEMPLATES['hyperglycemia'], None, False),
+        (operator.le, 50, _ALERT_TEMPLATES['hypoglycemia'], None, True),
+    )),
+)
+
+
+def _with_safe_bands(rule_groups):
+    """Attach each group's (safe_low, safe_high) open interval in which no rule can fire"""
+    groups = []
+    for attr, vs_involved, rules in rule_groups:
+        safe_low, safe_high = float('-inf'), float('inf')
+        for compare, threshold, *_ in rules:
+            if compare is operator.le:
+                safe_low = max(safe_low, threshold)
+            elif compare is operator.ge:
+                safe_high = min(safe_high, threshold)
+            else:
+                raise ValueError(f"Unsupported red flag comparison for {attr}")
+        groups.append((attr, vs_involved, safe_low, safe_high, rules))
+    return tuple(groups)
+
+
+# Secondary conditions only narrow when a rule fires, so the bands stay conservative
+_RED_FLAG_GROUPS = _with_safe_bands(_RED_FLAG_RULES)
+
+
+def _mk_flag(
+    template: Mapping[str, Any],
+    vs_involved: Tuple[str, ...],
+    timestamp: str,
+    **values: Any
+) -> RedFlag:
+    """Build a RedFlag from a shared template; action/vital tuples are not copied"""
+    return RedFlag(
+        level=template['level'],
+        title=template['title'],
+        message=template['message_fmt'].format(**values),
+        condition=template['condition'],
+        vital_signs_involved=vs_involved,
+        recommended_actions=template['recommended_actions'],
+        time_critical=template['time_critical'],
+        escalation_required=template['escalation_required'],
+        timestamp=timestamp
+    )
+
+
+@dataclass(slots=True)
 class VitalSignsAnalysis:
     """Complete vital signs analysis result"""
     vitals: VitalSigns
@@ -165,7 +538,7 @@ class VitalSignsAnalysis:
     def to_dict(self) -> Dict[str, Any]:
         return {
             'vitals': self.vitals.to_dict(),
-            'statuses': {k: v.value for k, v in self.statuses.items()},
+            'statuses': {k: _STATUS_NAMES[v] for k, v in self.statuses.items()},
             'red_flags': [rf.to_dict() for rf in self.red_flags],
             'sirs_criteria_met': self.sirs_criteria_met,
             'sirs_positive': self.sirs_positive,
@@ -175,6 +548,19 @@ class VitalSignsAnalysis:
         }
 
 
+# Vitals assessed by analyze(): (status key, VitalSigns attribute / range name,
+# use the age-independent 'all' ranges)
+_VITAL_SPECS = (
+    ('temperature', 'temperature_c', False),
+    ('heart_rate', 'heart_rate_bpm', False),
+    ('respiratory_rate', 'respiratory_rate_bpm', False),
+    ('systolic_bp', 'systolic_bp_mmhg', False),
+    ('diastolic_bp', 'diastolic_bp_mmhg', False),
+    ('spo2', 'spo2_percent', True),
+    ('gcs', 'gcs_score', True),
+)
+
+
 class VitalSignsAnalyzer:
 
 
@@ -202,41 +588,38 @@ class VitalSignsAnalyzer:
         self,
         value: Optional[float],
         vital_name: str,
-        age_group: str
+        age_group: str,
+        ranges_for_age: Optional[Mapping[str, _RangeRow]] = None
     ) -> VitalSignStatus:
 
 
         if value is None:
             return VitalSignStatus.NORMAL
 
-        # Get ranges for this vital and age group
-        ranges = VITAL_RANGES.get(vital_name, {})
+        # Callers pass their age group's row set; 'all' fallback is pre-resolved
+        if ranges_for_age is None:
+            ranges_for_age = _RANGES_BY_AGE.get(age_group, {})
+        range_data = ranges_for_age.get(vital_name)
 
-        # Try age-specific range, fall back to 'all'
-        range_data = ranges.get(age_group) or ranges.get('all')
-
-        if not range_data:
-            logger.warning(f"No ranges defined for {vital_name}, {age_group}")
+        if range_data is None:
+            logger.warning("No ranges defined for %s, %s", vital_name, age_group)
             return VitalSignStatus.NORMAL
 
+        low_critical, low, high, high_critical, low_margin, high_margin = range_data
+
         # Check critical ranges first
-        if range_data.get('low_critical') and value < range_data['low_critical']:
+        if low_critical and value < low_critical:
             return VitalSignStatus.CRITICAL
-        if range_data.get('high_critical') and value > range_data['high_critical']:
+        if high_critical and value > high_critical:
             return VitalSignStatus.CRITICAL
 
         # Check abnormal ranges
-        if value < range_data.get('low', float('-inf')):
+        if value < low:
             return VitalSignStatus.ABNORMAL
-        if value > range_data.get('high', float('inf')):
+        if value > high:
             return VitalSignStatus.ABNORMAL
 
-        # Check borderline (within 10% of threshold)
-        low = range_data.get('low', float('-inf'))
-        high = range_data.get('high', float('inf'))
-        low_margin = low * 1.1 if low > 0 else low + abs(low * 0.1)
-        high_margin = high * 0.9 if high > 0 else high - abs(high * 0.1)
-
+        # Check borderline (within 10% of threshold, margins precomputed)
         if value < low_margin or value > high_margin:
             return VitalSignStatus.BORDERLINE
 
@@ -245,268 +628,67 @@ class VitalSignsAnalyzer:
     def _detect_red_flags(
         self,
         vitals: VitalSigns,
-        statuses: Dict[str, VitalSignStatus]
+        statuses: Dict[str, VitalSignStatus],
+        timestamp: Optional[str] = None
     ) -> List[RedFlag]:
 
         red_flags = []
 
-        # Critical Temperature (Hyperthermia)
-        if vitals.temperature_c and vitals.temperature_c >= 40.0:
-            red_flags.append(RedFlag(
-                level=AlertLevel.EMERGENCY,
-                title="CRITICAL HYPERTHERMIA",
-                message=f"Temperature {vitals.temperature_c}°C - Immediate cooling measures required",
-                condition="Hyperthermia",
-                vital_signs_involved=['temperature'],
-                recommended_actions=[
-                    "Immediate cooling measures (ice packs, cooling blanket)",
-                    "Check for heat stroke, infection, drug reaction",
-                    "Monitor for seizures",
-                    "Consider ICU transfer"
-                ],
-                time_critical=True,
-                escalation_required=True
-            ))
-            self.critical_alerts += 1
-
-        # Critical Hypothermia
-        if vitals.temperature_c and vitals.temperature_c <= 35.0:
-            red_flags.append(RedFlag(
-                level=AlertLevel.EMERGENCY,
-                title="CRITICAL HYPOTHERMIA",
-                message=f"Temperature {vitals.temperature_c}°C - Warming required",
-                condition="Hypothermia",
-                vital_signs_involved=['temperature'],
-                recommended_actions=[
-                    "Active warming measures",
-                    "Warmed IV fluids",
-                    "Cardiac monitoring (risk of arrhythmia)",
-                    "Consider ICU"
-                ],
-                time_critical=True,
-                escalation_required=True
-            ))
-            self.critical_alerts += 1
-
-        # Severe Bradycardia
-        if vitals.heart_rate_bpm and vitals.heart_rate_bpm <= 40:
-            red_flags.append(RedFlag(
-                level=AlertLevel.EMERGENCY,
-                title="SEVERE BRADYCARDIA",
-                message=f"Heart rate {vitals.heart_rate_bpm} bpm - Risk of cardiac arrest",
-                condition="Bradycardia",
-                vital_signs_involved=['heart_rate'],
-                recommended_actions=[
-                    "Continuous cardiac monitoring",
-                    "12-lead ECG immediately",
-                    "Check medications (beta-blockers, etc.)",
-                    "Prepare atropine/pacing",
-                    "ACLS team notification"
-                ],
-                time_critical=True,
-                escalation_required=True
-            ))
-            self.critical_alerts += 1
-
-        # Severe Tachycardia
-        if vitals.heart_rate_bpm and vitals.heart_rate_bpm >= 140:
-            red_flags.append(RedFlag(
-                level=AlertLevel.CRITICAL,
-                title="SEVERE TACHYCARDIA",
-                message=f"Heart rate {vitals.heart_rate_bpm} bpm - Assess for shock/arrhythmia",
-                condition="Tachycardia",
-                vital_signs_involved=['heart_rate'],
-                recommended_actions=[
-                    "12-lead ECG",
-                    "Assess for shock (septic, hypovolemic, cardiogenic)",
-                    "Check for arrhythmia (SVT, AF, VT)",
-                    "Fluid status assessment",
-                    "Consider cardiology consult"
-                ],
-                time_critical=True,
-                escalation_required=True
-            ))
-            self.critical_alerts += 1
-
-        # Severe Hypotension
-        if vitals.systolic_bp_mmhg and vitals.systolic_bp_mmhg <= 70:
-            red_flags.append(RedFlag(
-                level=AlertLevel.EMERGENCY,
-                title="SEVERE HYPOTENSION / SHOCK",
-                message=f"BP {vitals.systolic_bp_mmhg}/{vitals.diastolic_bp_mmhg or '?'} - SHOCK PROTOCOL",
-                condition="Hypotensive Shock",
-                vital_signs_involved=['blood_pressure'],
-                recommended_actions=[
-                    "Initiate shock protocol immediately",
-                    "Fluid resuscitation (consider pressors)",
-                    "Identify shock type (septic/cardiogenic/hypovolemic)",
-                    "Blood cultures before antibiotics",
-                    "ICU notification",
-                    "Activate rapid response team"
-                ],
-                time_critical=True,
-                escalation_required=True
-            ))
-            self.critical_alerts += 1
-
-        # Hypertensive Emergency
-        if vitals.systolic_bp_mmhg and vitals.systolic_bp_mmhg >= 180:
-            if vitals.diastolic_bp_mmhg and vitals.diastolic_bp_mmhg >= 120:
-                red_flags.append(RedFlag(
-                    level=AlertLevel.EMERGENCY,
-                    title="HYPERTENSIVE EMERGENCY",
-                    message=f"BP {vitals.systolic_bp_mmhg}/{vitals.diastolic_bp_mmhg} - Risk of end-organ damage",
-                    condition="Hypertensive Emergency",
-                    vital_signs_involved=['blood_pressure'],
-                    recommended_actions=[
-                        "Assess for end-organ damage (stroke, MI, renal failure)",
-                        "Continuous BP monitoring",
-                        "IV antihypertensives (nicardipine, labetalol)",
-                        "Neuro exam, cardiac markers, renal function",
-                        "ICU admission likely required"
-                    ],
-                    time_critical=True,
-                    escalation_required=True
-                ))
-                self.critical_alerts += 1
-
-        # Critical Hypoxemia
-        if vitals.spo2_percent and vitals.spo2_percent <= 85:
-            red_flags.append(RedFlag(
-                level=AlertLevel.EMERGENCY,
-                title="CRITICAL HYPOXEMIA",
-                message=f"SpO2 {vitals.spo2_percent}% - Immediate oxygen/airway management",
-                condition="Severe Hypoxemia",
-                vital_signs_involved=['spo2'],
-                recommended_actions=[
-                    "High-flow oxygen immediately (non-rebreather mask)",
-                    "Assess airway patency",
-                    "Consider intubation if worsening",
-                    "Chest X-ray STAT",
-                    "ABG analysis",
-                    "Respiratory therapy consult"
-                ],
-                time_critical=True,
-                escalation_required=True
-            ))
-            self.critical_alerts += 1
-
-        # Respiratory Distress
-        if vitals.respiratory_rate_bpm:
-            if vitals.respiratory_rate_bpm <= 8:
-                red_flags.append(RedFlag(
-                    level=AlertLevel.EMERGENCY,
-                    title="SEVERE BRADYPNEA",
-                    message=f"Respiratory rate {vitals.respiratory_rate_bpm} - Risk of respiratory arrest",
-                    condition="Bradypnea",
-                    vital_signs_involved=['respiratory_rate'],
-                    recommended_actions=[
-                        "Assess airway immediately",
-                        "Check for narcotic overdose (naloxone if suspected)",
-                        "Prepare for airway management",
-                        "Consider ICU/intubation",
-                        "Continuous monitoring"
-                    ],
-                    time_critical=True,
-                    escalation_required=True
+        # Fetch each vital once; missing (falsy) readings and readings inside
+        # the group's safe band skip the rule scan entirely
+        for attr, vs_involved, safe_low, safe_high, rules in _RED_FLAG_GROUPS:
+            value = getattr(vitals, attr)
+            if not value or safe_low < value < safe_high:
+                continue
+
+            for compare, threshold, template, secondary, counts_alert in rules:
+                if not compare(value, threshold):
+                    continue
+
+                # Composite rules (hypertensive emergency) also need a second vital
+                if secondary is not None:
+                    other_attr, other_compare, other_threshold = secondary
+                    other = getattr(vitals, other_attr)
+                    if not (other and other_compare(other, other_threshold)):
+                        continue
+
+                # One timestamp shared by every flag raised in this analysis
+                if timestamp is None:
+                    timestamp = datetime.utcnow().isoformat()
+
+                red_flags.append(_mk_flag(
+                    template,
+                    vs_involved,
+                    timestamp,
+                    v=value,
+                    dbp=vitals.diastolic_bp_mmhg or '?'
                 ))
-                self.critical_alerts += 1
-            elif vitals.respiratory_rate_bpm >= 30:
-                red_flags.append(RedFlag(
-                    level=AlertLevel.CRITICAL,
-                    title="SEVERE TACHYPNEA",
-                    message=f"Respiratory rate {vitals.respiratory_rate_bpm} - Respiratory distress",
-                    condition="Tachypnea",
-                    vital_signs_involved=['respiratory_rate'],
-                    recommended_actions=[
-                        "Assess work of breathing",
-                        "Oxygen supplementation",
-                        "Check for pneumonia, PE, pulmonary edema",
-                        "Consider CPAP/BiPAP",
-                        "Respiratory therapy consult"
-                    ],
-                    time_critical=True,
-                    escalation_required=False
-                ))
-
-        # Altered Mental Status (GCS)
-        if vitals.gcs_score and vitals.gcs_score <= 8:
-            red_flags.append(RedFlag(
-                level=AlertLevel.EMERGENCY,
-                title="SEVERELY ALTERED MENTAL STATUS",
-                message=f"GCS {vitals.gcs_score} - Consider airway protection",
-                condition="Altered Mental Status",
-                vital_signs_involved=['gcs'],
-                recommended_actions=[
-                    "Protect airway (GCS ≤8 = intubation threshold)",
-                    "CT head STAT",
-                    "Check glucose immediately",
-                    "Toxicology screen",
-                    "Neurology consult",
-                    "ICU admission"
-                ],
-                time_critical=True,
-                escalation_required=True
-            ))
-            self.critical_alerts += 1
-
-        # Severe Hyperglycemia
-        if vitals.blood_glucose_mgdl and vitals.blood_glucose_mgdl >= 400:
-            red_flags.append(RedFlag(
-                level=AlertLevel.CRITICAL,
-                title="SEVERE HYPERGLYCEMIA",
-                message=f"Blood glucose {vitals.blood_glucose_mgdl} mg/dL - Risk of DKA/HHS",
-                condition="Hyperglycemia",
-                vital_signs_involved=['blood_glucose'],
-                recommended_actions=[
-                    "Check for DKA (BMP, VBG, ketones, anion gap)",
-                    "Start insulin drip if DKA confirmed",
-                    "Aggressive IV fluid resuscitation",
-                    "Potassium monitoring",
-                    "Endocrinology consult"
-                ],
-                time_critical=True,
-                escalation_required=False
-            ))
-
-        # Severe Hypoglycemia
-        if vitals.blood_glucose_mgdl and vitals.blood_glucose_mgdl <= 50:
-            red_flags.append(RedFlag(
-                level=AlertLevel.EMERGENCY,
-                title="SEVERE HYPOGLYCEMIA",
-                message=f"Blood glucose {vitals.blood_glucose_mgdl} mg/dL - Immediate treatment required",
-                condition="Hypoglycemia",
-                vital_signs_involved=['blood_glucose'],
-                recommended_actions=[
-                    "D50 IV push immediately (if conscious: PO glucose)",
-                    "Continuous glucose monitoring",
-                    "Check insulin/sulfonylurea levels",
-                    "Assess for altered mental status",
-                    "Prevent recurrence"
-                ],
-                time_critical=True,
-                escalation_required=True
-            ))
-            self.critical_alerts += 1
+                if counts_alert:
+                    self.critical_alerts += 1
+                break
 
         return red_flags
 
     def _calculate_sirs_criteria(self, vitals: VitalSigns) -> Tuple[int, bool]:
 
 
+        temp = vitals.temperature_c
+        hr = vitals.heart_rate_bpm
+        rr = vitals.respiratory_rate_bpm
+
         criteria_met = 0
 
         # Temperature criterion
-        if vitals.temperature_c:
-            if vitals.temperature_c > 38.0 or vitals.temperature_c < 36.0:
+        if temp:
+            if temp > 38.0 or temp < 36.0:
                 criteria_met += 1
 
         # Heart rate criterion
-        if vitals.heart_rate_bpm and vitals.heart_rate_bpm > 90:
+        if hr and hr > 90:
             criteria_met += 1
 
         # Respiratory rate criterion
-        if vitals.respiratory_rate_bpm and vitals.respiratory_rate_bpm > 20:
+        if rr and rr > 20:
             criteria_met += 1
 
         # WBC criterion would require lab data (not available in vitals)
@@ -515,89 +697,20 @@ class VitalSignsAnalyzer:
         is_positive = criteria_met >= 2
 
         if is_positive:
-            logger.warning(f"SIRS criteria met: {criteria_met}/4 (3 assessed)")
+            logger.warning("SIRS criteria met: %d/4 (3 assessed)", criteria_met)
 
         return criteria_met, is_positive
 
     def _calculate_news_score(self, vitals: VitalSigns) -> int:
 
-        score = 0
-
-        # Respiratory rate (0-3 points)
-        if vitals.respiratory_rate_bpm:
-            rr = vitals.respiratory_rate_bpm
-            if rr <= 8:
-                score += 3
-            elif rr <= 11:
-                score += 1
-            elif rr <= 20:
-                score += 0
-            elif rr <= 24:
-                score += 2
-            else:  # ≥25
-                score += 3
-
-        # SpO2 (0-3 points)
-        if vitals.spo2_percent:
-            spo2 = vitals.spo2_percent
-            if spo2 <= 91:
-                score += 3
-            elif spo2 <= 93:
-                score += 2
-            elif spo2 <= 95:
-                score += 1
-            else:  # ≥96
-                score += 0
-
-        # Systolic BP (0-3 points)
-        if vitals.systolic_bp_mmhg:
-            sbp = vitals.systolic_bp_mmhg
-            if sbp <= 90:
-                score += 3
-            elif sbp <= 100:
-                score += 2
-            elif sbp <= 110:
-                score += 1
-            elif sbp <= 219:
-                score += 0
-            else:  # ≥220
-                score += 3
-
-        # Heart rate (0-3 points)
-        if vitals.heart_rate_bpm:
-            hr = vitals.heart_rate_bpm
-            if hr <= 40:
-                score += 3
-            elif hr <= 50:
-                score += 1
-            elif hr <= 90:
-                score += 0
-            elif hr <= 110:
-                score += 1
-            elif hr <= 130:
-                score += 2
-            else:  # ≥131
-                score += 3
-
-        # Temperature (0-3 points)
-        if vitals.temperature_c:
-            temp = vitals.temperature_c
-            if temp <= 35.0:
-                score += 3
-            elif temp <= 36.0:
-                score += 1
-            elif temp <= 38.0:
-                score += 0
-            elif temp <= 39.0:
-                score += 1
-            else:  # ≥39.1
-                score += 2
-
-        # Level of consciousness (0 or 3 points)
-        if vitals.gcs_score and vitals.gcs_score < 15:
-            score += 3
-
-        return score
+        return _news_score(
+            vitals.respiratory_rate_bpm,
+            vitals.spo2_percent,
+            vitals.systolic_bp_mmhg,
+            vitals.heart_rate_bpm,
+            vitals.temperature_c,
+            vitals.gcs_score
+        )
 
     def analyze(self, vitals: VitalSigns) -> VitalSignsAnalysis:
 
@@ -605,114 +718,120 @@ class VitalSignsAnalyzer:
             raise ValueError("Invalid vitals data")
 
         self.total_analyses += 1
-        logger.info(f"Analyzing vital signs #{self.total_analyses}")
+        logger.info("Analyzing vital signs #%d", self.total_analyses)
 
         try:
-            # Determine age group
-            age_group = self._get_age_group(vitals.age_years)
-
-            # Assess each vital sign
-            statuses = {}
-
-            if vitals.temperature_c is not None:
-                statuses['temperature'] = self._assess_vital_sign(
-                    vitals.temperature_c, 'temperature_c', age_group
-                )
-
-            if vitals.heart_rate_bpm is not None:
-                statuses['heart_rate'] = self._assess_vital_sign(
-                    vitals.heart_rate_bpm, 'heart_rate_bpm', age_group
-                )
-
-            if vitals.respiratory_rate_bpm is not None:
-                statuses['respiratory_rate'] = self._assess_vital_sign(
-                    vitals.respiratory_rate_bpm, 'respiratory_rate_bpm', age_group
-                )
-
-            if vitals.systolic_bp_mmhg is not None:
-                statuses['systolic_bp'] = self._assess_vital_sign(
-                    vitals.systolic_bp_mmhg, 'systolic_bp_mmhg', age_group
-                )
-
-            if vitals.diastolic_bp_mmhg is not None:
-                statuses['diastolic_bp'] = self._assess_vital_sign(
-                    vitals.diastolic_bp_mmhg, 'diastolic_bp_mmhg', age_group
-                )
-
-            if vitals.spo2_percent is not None:
-                statuses['spo2'] = self._assess_vital_sign(
-                    vitals.spo2_percent, 'spo2_percent', 'all'
-                )
-
-            if vitals.gcs_score is not None:
-                statuses['gcs'] = self._assess_vital_sign(
-                    vitals.gcs_score, 'gcs_score', 'all'
-                )
-
-            # Detect red flags
-            red_flags = self._detect_red_flags(vitals, statuses)
+            analysis = self._analyze_one(vitals)
+        except Exception as e:
+            logger.error("Error in vital signs analysis: %s", e, exc_info=True)
+            raise
 
-            # Calculate SIRS criteria
-            sirs_met, sirs_positive = self._calculate_sirs_criteria(vitals)
+        logger.info(
+            "Analysis complete: %s severity, %d red flags, NEWS=%d",
+            analysis.severity, len(analysis.red_flags), analysis.news_score
+        )
 
-            # Calculate NEWS score
-            news_score = self._calculate_news_score(vitals)
+        return analysis
 
-            # Determine overall severity
-            severity = "normal"
-            if any(status == VitalSignStatus.CRITICAL for status in statuses.values()):
-                severity = "critical"
-            elif any(status == VitalSignStatus.ABNORMAL for status in statuses.values()):
-                severity = "abnormal"
-            elif any(status == VitalSignStatus.BORDERLINE for status in statuses.values()):
-                severity = "borderline"
+    def analyze_batch(self, vitals_list: List[VitalSigns]) -> List[VitalSignsAnalysis]:
+        """Analyze a ward's worth of readings with one validation pass and one log line"""
+        vitals_list = list(vitals_list)
+        if not all(isinstance(vitals, VitalSigns) for vitals in vitals_list):
+            raise ValueError("Invalid vitals data")
 
-            # Generate recommendations
-            recommendations = []
+        self.total_analyses += len(vitals_list)
+        logger.info("Analyzing batch of %d vital signs", len(vitals_list))
 
-            if red_flags:
-                recommendations.append(
-                    f"⚠️ {len(red_flags)} critical alert(s) - immediate attention required"
-                )
+        try:
+            analyses = [self._analyze_one(vitals) for vitals in vitals_list]
+        except Exception as e:
+            logger.error("Error in vital signs batch analysis: %s", e, exc_info=True)
+            raise
 
-            if sirs_positive:
-                recommendations.append(
-                    f"⚠️ SIRS criteria met ({sirs_met}/4) - assess for sepsis"
-                )
+        # The red flag total is a full pass, so only compute it when it will be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Batch complete: %d red flags across %d patients",
+                sum(len(a.red_flags) for a in analyses), len(analyses)
+            )
 
-            if news_score >= 7:
-                recommendations.append(
-                    f"⚠️ High NEWS score ({news_score}) - urgent medical review required"
-                )
-            elif news_score >= 5:
-                recommendations.append(
-                    f"⚠️ Medium NEWS score ({news_score}) - increased monitoring frequency"
-                )
+        return analyses
+
+    def _analyze_one(self, vitals: VitalSigns) -> VitalSignsAnalysis:
+        """Core single-patient analysis shared by analyze() and analyze_batch()"""
+        # Determine age group
+        age_group = self._get_age_group(vitals.age_years)
+        ranges_for_age = _RANGES_BY_AGE[age_group]
+        ranges_for_all = _RANGES_BY_AGE['all']
+
+        # Assess each vital sign
+        statuses = {}
+
+        for status_key, attr, use_all_ranges in _VITAL_SPECS:
+            value = getattr(vitals, attr)
+            if value is not None:
+                if use_all_ranges:
+                    statuses[status_key] = self._assess_vital_sign(
+                        value, attr, 'all', ranges_for_all
+                    )
+                else:
+                    statuses[status_key] = self._assess_vital_sign(
+                        value, attr, age_group, ranges_for_age
+                    )
+
+        # Detect red flags
+        red_flags = self._detect_red_flags(vitals, statuses)
+
+        # Calculate SIRS criteria
+        sirs_met, sirs_positive = self._calculate_sirs_criteria(vitals)
+
+        # Calculate NEWS score
+        news_score = self._calculate_news_score(vitals)
+
+        # Determine overall severity (worst status wins, single pass)
+        max_status = VitalSignStatus.NORMAL
+        for status in statuses.values():
+            if status > max_status:
+                max_status = status
+        severity = _SEVERITY_BY_RANK[max_status]
+
+        # Generate recommendations
+        recommendations = []
+
+        if red_flags:
+            recommendations.append(
+                f"⚠️ {len(red_flags)} critical alert(s) - immediate attention required"
+            )
 
-            if not vitals.is_complete():
-                recommendations.append(
-                    "ℹ️ Incomplete vital signs - obtain missing measurements"
-                )
+        if sirs_positive:
+            recommendations.append(
+                f"⚠️ SIRS criteria met ({sirs_met}/4) - assess for sepsis"
+            )
 
-            logger.info(
-                f"Analysis complete: {severity} severity, "
-                f"{len(red_flags)} red flags, NEWS={news_score}"
+        if news_score >= 7:
+            recommendations.append(
+                f"⚠️ High NEWS score ({news_score}) - urgent medical review required"
+            )
+        elif news_score >= 5:
+            recommendations.append(
+                f"⚠️ Medium NEWS score ({news_score}) - increased monitoring frequency"
             )
 
-            return VitalSignsAnalysis(
-                vitals=vitals,
-                statuses=statuses,
-                red_flags=red_flags,
-                sirs_criteria_met=sirs_met,
-                sirs_positive=sirs_positive,
-                news_score=news_score,
-                severity=severity,
-                recommendations=recommendations
+        if not vitals.is_complete():
+            recommendations.append(
+                "ℹ️ Incomplete vital signs - obtain missing measurements"
             )
 
-        except Exception as e:
-            logger.error(f"Error in vital signs analysis: {e}", exc_info=True)
-            raise
+        return VitalSignsAnalysis(
+            vitals=vitals,
+            statuses=statuses,
+            red_flags=red_flags,
+            sirs_criteria_met=sirs_met,
+            sirs_positive=sirs_positive,
+            news_score=news_score,
+            severity=severity,
+            recommendations=recommendations
+        )
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get analyzer statistics"""